@@ -0,0 +1,239 @@
+"""
+Measures the overhead of classy decorators, compared to hand-written
+`functools.wraps` decorators, for subclass creation, decoration, binding and
+calling.
+
+    python benchmarks/suite.py [--json] [--number N] [--repeat N]
+
+With `--json`, the results are written to stdout as a JSON object, so that
+they can be stored and compared over time.
+"""
+import argparse
+import functools
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from classy_decorators import Decorator
+
+VERSION = (Path(__file__).parent.parent / "VERSION").read_text().strip()
+
+
+class Passthrough(Decorator):
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs)
+
+
+class DecorateOnly(Decorator):
+    def __decorate__(self, **kwargs):
+        self.decorated = True
+
+
+class Multiply(Decorator):
+    factor: int
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+def passthrough(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def multiply(factor):
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            return function(*args, **kwargs) * factor
+
+        return wrapper
+
+    return decorator
+
+
+def add(a, b):
+    return a + b
+
+
+class Spam:
+    @Passthrough
+    def method(self, a, b):
+        return a + b
+
+    @Passthrough
+    @classmethod
+    def class_method(cls, a, b):
+        return a + b
+
+    @Passthrough
+    @staticmethod
+    def static_method(a, b):
+        return a + b
+
+    @DecorateOnly
+    def method_decorate_only(self, a, b):
+        return a + b
+
+    @passthrough
+    def method_wrapped(self, a, b):
+        return a + b
+
+    @classmethod
+    @passthrough
+    def class_method_wrapped(cls, a, b):
+        return a + b
+
+    @staticmethod
+    @passthrough
+    def static_method_wrapped(a, b):
+        return a + b
+
+    @Passthrough
+    @Passthrough
+    @Passthrough
+    def method_stacked(self, a, b):
+        return a + b
+
+    @passthrough
+    @passthrough
+    @passthrough
+    def method_stacked_wrapped(self, a, b):
+        return a + b
+
+
+def _subclass(base: type) -> type:
+    return type("Sub", (base,), {"__annotations__": {"n": int}, "n": 1})
+
+
+class Case(NamedTuple):
+    name: str
+    # statements for the classy decorator and for the baseline
+    stmt: str
+    baseline: str
+
+
+spam = Spam()
+NAMESPACE: Dict[str, Any] = {
+    **globals(),
+    "spam": spam,
+    "add_decorated": Passthrough(add),
+    "add_decorated_only": DecorateOnly(add),
+    "add_wrapped": passthrough(add),
+    "method_decorated": spam.method,
+    "method_wrapped": spam.method_wrapped,
+    "class_method_decorated": Spam.class_method,
+    "class_method_wrapped": Spam.class_method_wrapped,
+    "static_method_decorated": Spam.static_method,
+    "static_method_wrapped": Spam.static_method_wrapped,
+}
+
+CASES: List[Case] = [
+    Case("subclass", "_subclass(Decorator)", "_subclass(object)"),
+    Case("decorate", "Passthrough(add)", "passthrough(add)"),
+    Case("decorate_params", "Multiply(factor=2)(add)", "multiply(2)(add)"),
+    Case("bind_instancemethod", "spam.method", "spam.method_wrapped"),
+    Case(
+        "bind_classmethod", "Spam.class_method", "Spam.class_method_wrapped"
+    ),
+    Case(
+        "bind_staticmethod",
+        "Spam.static_method",
+        "Spam.static_method_wrapped",
+    ),
+    Case("bind_stacked", "spam.method_stacked", "spam.method_stacked_wrapped"),
+    Case("call_function", "add_decorated(1, 2)", "add_wrapped(1, 2)"),
+    Case(
+        "call_function_decorate_only",
+        "add_decorated_only(1, 2)",
+        "add_wrapped(1, 2)",
+    ),
+    Case("call_method", "method_decorated(1, 2)", "method_wrapped(1, 2)"),
+    Case(
+        "call_classmethod",
+        "class_method_decorated(1, 2)",
+        "class_method_wrapped(1, 2)",
+    ),
+    Case(
+        "call_staticmethod",
+        "static_method_decorated(1, 2)",
+        "static_method_wrapped(1, 2)",
+    ),
+    # binding and calling, as in `spam.method(1, 2)`
+    Case(
+        "bind_call_method",
+        "spam.method(1, 2)",
+        "spam.method_wrapped(1, 2)",
+    ),
+]
+
+
+def _time(stmt: str, number: Optional[int], repeat: int) -> float:
+    """
+    Returns the fastest time in nanoseconds. If number isn't set, it's
+    determined with `timeit.Timer.autorange`.
+    """
+    timer = timeit.Timer(stmt, globals=NAMESPACE)
+    if number is None:
+        number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def run(number: Optional[int] = None, repeat: int = 3) -> List[Dict[str, Any]]:
+    results = []
+    for case in CASES:
+        classy_ns = _time(case.stmt, number, repeat)
+        baseline_ns = _time(case.baseline, number, repeat)
+        results.append(
+            {
+                "name": case.name,
+                "classy_ns": round(classy_ns, 1),
+                "baseline_ns": round(baseline_ns, 1),
+                "ratio": round(classy_ns / baseline_ns, 2),
+            }
+        )
+    return results
+
+
+def _print_table(results: List[Dict[str, Any]]):
+    print(f"{'':<28}{'classy':>10}{'baseline':>12}{'ratio':>8}")
+    for res in results:
+        print(
+            f"{res['name']:<28}"
+            f"{res['classy_ns']:>8.0f}ns"
+            f"{res['baseline_ns']:>10.0f}ns"
+            f"{res['ratio']:>7.2f}x"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--json", action="store_true", help="output JSON")
+    parser.add_argument("--number", type=int, help="loops per repeat")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.repeat)
+    if args.json:
+        report = {
+            "version": VERSION,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "number": args.number,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,6 @@
 from .decorators import *  # noqa: F401,F403
+from .memoize import *  # noqa: F401,F403
+from .offload import *  # noqa: F401,F403
+from .coalesce import *  # noqa: F401,F403
+from .singleflight import *  # noqa: F401,F403
+from .limits import *  # noqa: F401,F403
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+__all__ = ["Coalesce"]
+
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from classy_decorators.decorators import Decorator, _get_scoped
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+
+class _Batch:
+    """The pending calls of a decorated function, within one event loop."""
+
+    __slots__ = ("decorator", "keys", "futures", "handle")
+
+    def __init__(self, decorator: Coalesce):
+        # the binding by which the batch is called
+        self.decorator = decorator
+        self.keys: List[Any] = []
+        self.futures: List[asyncio.Future] = []
+        # the scheduled dispatch
+        self.handle: Optional[asyncio.Handle] = None
+
+
+class _Queue:
+    """The pending batches of a function, instance or class, by event loop."""
+
+    __slots__ = ("batches",)
+
+    def __init__(self):
+        self.batches: Dict[asyncio.AbstractEventLoop, _Batch] = {}
+
+
+class Coalesce(Decorator):
+    """
+    Coalesces concurrent calls of the decorated async function or method,
+    dataloader-style. The decorated function is the batch implementation:
+    it's called with a list of keys, and returns a list of results in the
+    same order. Callers pass a single key instead, and await their own result.
+
+    The calls are collected until the next iteration of the event loop, or
+    for `max_delay` seconds if set, and for at most `max_batch_size` keys.
+    Instance methods have a queue per instance, and classmethods per class.
+    If the batch call raises, the exception is raised to all of its callers.
+
+    Overrides of `__call_inner_async__` in subclasses run for each caller,
+    with its single key, before it's queued. The batch call runs the
+    `__call_inner_async__` of the classes that follow `Coalesce` in the MRO.
+    """
+
+    max_batch_size: int = 100
+    # seconds to wait for more calls, if set
+    max_delay: float = 0.0
+
+    def __decorate__(self, **kwargs):
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if self.max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        if not self.is_coroutinefunction:
+            raise TypeError(f"cannot coalesce {self}, it isn't async")
+
+        if self.is_instancemethod or self.is_classmethod:
+            # id of the instance or class => (weakref, queue)
+            self._queues: Dict[int, Tuple[weakref.ref, _Queue]] = {}
+        else:
+            self._queue = _Queue()
+
+    def __bind__(self, instance_or_class):
+        if self.is_instancemethod or self.is_classmethod:
+            self._queue = _get_scoped(
+                self, instance_or_class, self._queues, _Queue, "coalesce"
+            )
+
+    async def __call_inner_async__(self, *args, **kwargs) -> Any:
+        if len(args) != 1 or kwargs:
+            raise TypeError(f"{self} must be called with a single key")
+
+        # asyncio is imported once a coroutine runs
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        batches = self._queue.batches
+        if (batch := batches.get(loop)) is None:
+            batch = batches[loop] = _Batch(self)
+            if self.max_delay:
+                batch.handle = loop.call_later(
+                    self.max_delay, _dispatch, batches, loop, batch
+                )
+            else:
+                batch.handle = loop.call_soon(_dispatch, batches, loop, batch)
+
+        future = loop.create_future()
+        batch.keys.append(args[0])
+        batch.futures.append(future)
+        if len(batch.keys) >= self.max_batch_size:
+            _dispatch(batches, loop, batch)
+
+        return await future
+
+
+# the running batch calls, which the event loop only references weakly
+_tasks: Set[asyncio.Task] = set()
+
+
+def _dispatch(
+    batches: Dict[asyncio.AbstractEventLoop, _Batch],
+    loop: asyncio.AbstractEventLoop,
+    batch: _Batch,
+):
+    if batches.get(loop) is not batch:
+        # already dispatched once full
+        return
+
+    del batches[loop]
+    if batch.handle is not None:
+        batch.handle.cancel()
+
+    task = loop.create_task(_call_batch(batch))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def _call_batch(batch: _Batch):
+    """
+    Calls the decorated function with the keys, through the next
+    `__call_inner_async__` after `Coalesce` in the MRO, and sets the futures.
+    """
+    import asyncio
+
+    decorator, futures = batch.decorator, batch.futures
+    try:
+        results = await super(Coalesce, decorator).__call_inner_async__(
+            batch.keys
+        )
+        results = list(results)
+        if len(results) != len(futures):
+            raise ValueError(
+                f"{decorator} returned {len(results)} results for "
+                f"{len(futures)} keys"
+            )
+    except asyncio.CancelledError:
+        for future in futures:
+            future.cancel()
+        raise
+    except Exception as exc:
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+    else:
+        for future, result in zip(futures, results):
+            # unless the caller was cancelled
+            if not future.done():
+                future.set_result(result)
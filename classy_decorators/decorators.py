@@ -3,19 +3,32 @@ from __future__ import annotations
 __all__ = ["Decorator"]
 
 import functools
+import itertools
+import operator
+import sys
+import threading
+import time
 import types
+import weakref
 from typing import (
     Any,
+    AsyncGenerator,
     Callable,
     ClassVar,
     Dict,
     Final,
     FrozenSet,
+    Generator,
     Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
     NoReturn,
     Optional,
     Protocol,
-    Set,
+    Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -27,20 +40,16 @@ from typing import (
     overload,
 )
 
-try:
-    import typeguard
-except ImportError:
-    typeguard = NotImplemented
-    _TYPEGUARD = False
-else:
-    _TYPEGUARD = True
-
+from classy_decorators import instrumentation
 from classy_decorators.function_types import (
     ClassMethod,
     ClassMethodDescriptor,
     FunctionType,
     get_function_type,
+    is_asyncgenfunction,
+    is_coroutinefunction,
     is_decoratable,
+    is_generatorfunction,
 )
 
 # type to which the decorated method is bound
@@ -54,6 +63,10 @@ FT = TypeVar("FT", bound=Callable[..., Any])
 _FT = TypeVar("_FT", bound=Callable[..., Any])
 # classmethod descriptor
 CMD = TypeVar("CMD", classmethod, staticmethod)
+# class decorated by `Decorator.apply_to_class`
+C = TypeVar("C", bound=type)
+# state per instance or class, see `_get_scoped`
+S = TypeVar("S")
 
 MaybeFT = TypeVar("MaybeFT", covariant=True)
 Decoratable = Union[FT, ClassMethod[FT], ClassMethodDescriptor[Any, FT]]
@@ -68,16 +81,23 @@ Missing = _MissingType()
 
 class Param(Generic[PT]):
     # based on dataclassed.Field.__set_name__
-    __slots__ = ("name", "type", "default")
+    __slots__ = ("name", "type", "default", "checker", "owner")
 
     name: Union[str, _MissingType]
-    type: Union[Type[PT], _MissingType]
+    # string annotations are resolved once needed, see `resolve`
+    type: Union[Type[PT], str, _MissingType]
     default: Union[PT, _MissingType]
+    # see `_type_checker`
+    checker: Optional[Callable[[Any], Optional[bool]]]
+    # the class in which the param is annotated
+    owner: Union[Type[Decorator], _MissingType]
 
     def __init__(self, *, default: Union[PT, _MissingType] = Missing):
         self.name = Missing
         self.type = Missing
         self.default = default
+        self.checker = None
+        self.owner = Missing
 
     def __repr__(self):
         return (
@@ -93,32 +113,42 @@ class Param(Generic[PT]):
         Checks if arg is of the param type.
         Uses typeguard if installed, otherwise a simple typechecking of the
         origin type is done and returns None if the type could not be checked.
+        Classes and unions of classes are always checked with `isinstance`.
         """
-        if self.type is Missing:  # pragma: no cover
-            raise TypeError("decorator param has no type")
-        if self.name is Missing:  # pragma: no cover
-            raise TypeError("decorator param has no name")
-
-        if _TYPEGUARD:
-            try:
-                typeguard.check_type(cast(str, self.name), arg, self.type)
-            except TypeError:
-                return False
-            else:
-                return True
-        else:
-            return _isinstance_typing(arg, cast(Type[PT], self.type))
+        return (self.checker or self.resolve())(arg)
 
     def check_type(self, arg):
-        if self.name is Missing:  # pragma: no cover
-            raise TypeError("decorator param has no name")
-
-        if self.is_of_type(arg) is False:
+        if (self.checker or self.resolve())(arg) is False:
             raise TypeError(
                 f"type of decorator parameter '{self.name}' must be "
                 f"'{self.type}'; got '{type(arg)}' instead"
             )
 
+    def resolve(self) -> Callable[[Any], Optional[bool]]:
+        """
+        Evaluates a string annotation in the namespace of its class, creates
+        the type checker, and checks the type of the default.
+        """
+        if self.checker is not None:
+            return self.checker
+        if self.type is Missing or self.owner is Missing:  # pragma: no cover
+            raise TypeError("decorator param has no type")
+
+        if isinstance(self.type, str):
+            # the name is set along with the owner, see `_get_param`
+            assert isinstance(self.name, str)
+            self.type = get_type_hints(self.owner)[self.name]
+
+        checker = _type_checker(self.type)
+        if self.default is not Missing and checker(self.default) is False:
+            raise TypeError(
+                f"type of decorator parameter default '{self.name}' must be "
+                f"'{self.type}'; got '{type(self.default)}' instead"
+            )
+
+        self.checker = checker
+        return checker
+
 
 class BaseDecoratorType(Protocol[MaybeFT]):
     __init__: Callable
@@ -137,6 +167,7 @@ class DecoratorType(BaseDecoratorType[FT]):
         _unbound_function_type: Optional[FunctionType],
         _param_values: Dict[str, Any],
         _decorate: bool,
+        _function_type: Optional[FunctionType] = None,
     ) -> None:
         ...  # pragma: no cover
 
@@ -151,6 +182,7 @@ class DecoratorType(BaseDecoratorType[FT]):
         _unbound_function_type: Optional[FunctionType] = None,
         _param_values: Optional[Dict[str, Any]] = None,
         _decorate: bool = True,
+        _function_type: Optional[FunctionType] = None,
         **__kwargs,
     ) -> None:
         ...  # pragma: no cover
@@ -171,9 +203,54 @@ class Decorator(Generic[D, MaybeFT]):
     """
     Base class for writing decorators to use on functions, methods,
     classmethods or staticmethods.
+
+    Subclasses that declare `__slots__` have a compact layout without instance
+    `__dict__`; see `__decorator_slotted__`.
+
+    Decorating, binding and `__bind__` are thread-safe, also without GIL.
+    Each binding is a new instance, so `__bind__` can set attributes without
+    locking. The state that is shared by bindings is replaced instead of
+    changed, and it's created while holding a lock; see `__rebind`.
     """
 
+    __slots__ = (
+        "__func_wrapped",
+        "__func__",
+        "__self__",
+        "__kind",
+        "__unbound_function_type",
+        "__param_values",
+        "__bound_state",
+        "__call_stats",
+        "__owner",
+        "__owner_binding",
+        "__call_attr",
+        "__call_target",
+        "__weakref__",
+    )
+
     __decorator_params__: ClassVar[Dict[str, Param]]
+    # names of the params without default
+    __decorator_required__: ClassVar[FrozenSet[str]]
+    # whether the string annotations of the params are resolved, which is
+    # done when the decorator class is first used, see `Param.resolve`
+    __decorator_resolved__: ClassVar[bool]
+    # whether instances have no `__dict__`; if so, param values are stored in a
+    # single (shared) dict, and the function attributes like `__name__` are
+    # looked up on the decorated function when needed
+    __decorator_slotted__: ClassVar[bool]
+    # instance attributes declared in the `__slots__` of subclasses
+    __decorator_slots__: ClassVar[Tuple[str, ...]]
+    # whether __call_inner__ isn't overridden, i.e. calls are passed through
+    __decorator_passthrough__: ClassVar[bool]
+    # whether call stats are recorded, see `instrumentation`
+    __decorator_instrumented__: ClassVar[bool] = False
+    # 1 in how many calls is recorded, and the profiler of those calls; the
+    # defaults of the `instrumentation.CallStats` of the decorated functions
+    __decorator_sample__: ClassVar[int] = 1
+    __decorator_profile__: ClassVar[Optional[str]] = None
+    # whether bound instance methods reference their instance weakly
+    __decorator_weak__: ClassVar[bool] = False
 
     @final
     def __init__(
@@ -182,109 +259,323 @@ class Decorator(Generic[D, MaybeFT]):
         _unbound_function_type=None,
         _param_values=None,
         _decorate=True,
+        _function_type=None,
         **kwargs,
     ):
+        if not self.__decorator_resolved__:
+            _resolve_params(type(self))
+
+        self.__bound_state = None
+        self.__call_attr = _CALL_UNWRAPPED_ATTR
+        self.__call_target: Optional[str] = None
         self.__unbound_function_type = _unbound_function_type
         self.__param_values: Dict[str, Any] = _param_values or {}
+        # the class and name, see `__set_name__`
+        self.__owner: Optional[Tuple[type, str]] = None
+        # (bound state, owner, templates of the binding, inner layers with
+        # their bound states) of a class- or staticmethod, see `__get__`
+        self.__owner_binding: Optional[
+            Tuple[
+                Any, type, List[_Template], Tuple[Tuple[Decorator, Any], ...]
+            ]
+        ] = None
 
         if _param_values is None and (
             kwargs
             or len(args) != 1
-            or self._required_params
+            or self.__decorator_required__
             or not is_decoratable(args[0])
         ):
             # postpone __decorate__ call until wrapped
             _decorate = False
-
-            for arg, (name, param) in zip(
-                args, self.__decorator_params__.items()
-            ):
-                param.check_type(arg)
-                self.__param_values[name] = arg
-
-            for name, arg in kwargs.items():
-                if name not in self.__decorator_params__:
-                    raise ValueError(
-                        f"'{name}' is an invalid decorator param for "
-                        f"'{type(self).__name__}'"
-                    )
-                if name in self.__param_values:
-                    raise ValueError(
-                        f"multiple values provided for decorator param "
-                        f"'{name}'"
-                    )
-
-                param = self.__decorator_params__[name]
-                param.check_type(arg)
-                self.__param_values[name] = arg
+            self.__set_param_values(args, kwargs)
 
         elif len(args) != 1 or kwargs:  # pragma: no cover
             raise ValueError(f"'{type(self).__name__}' must have one argument")
 
         else:
-            self.__set_function(args[0])
+            self.__set_function(args[0], _function_type)
 
         kwargs = {}
         for name, param in self.__decorator_params__.items():
             if name not in self.__param_values and param.default is Missing:
                 raise ValueError(f"decorator param '{name}' is required")
 
-            value = self.__param_values.get(name, param.default)
-            kwargs[name] = value
-            setattr(self, name, value)
+            kwargs[name] = self.__param_values.get(name, param.default)
+
+        if self.__decorator_slotted__:
+            # see `_ParamAttribute`
+            self.__param_values = dict(kwargs)
+        else:
+            for name, value in kwargs.items():
+                setattr(self, name, value)
 
         if _decorate:
             self.__decorate__(**kwargs)
 
-    def __init_subclass__(cls, /, **kwargs):
+    def __set_param_values(self, args: tuple, kwargs: Dict[str, Any]):
+        """Checks and stores the param values of a partial decorator."""
+        for arg, (name, param) in zip(args, self.__decorator_params__.items()):
+            param.check_type(arg)
+            self.__param_values[name] = arg
+
+        for name, arg in kwargs.items():
+            if name not in self.__decorator_params__:
+                raise ValueError(
+                    f"'{name}' is an invalid decorator param for "
+                    f"'{type(self).__name__}'"
+                )
+            if name in self.__param_values:
+                raise ValueError(
+                    f"multiple values provided for decorator param '{name}'"
+                )
+
+            param = self.__decorator_params__[name]
+            param.check_type(arg)
+            self.__param_values[name] = arg
+
+    def __init_subclass__(
+        cls,
+        /,
+        instrumented: Optional[bool] = None,
+        weak: Optional[bool] = None,
+        sample: Optional[int] = None,
+        profile: Union[str, None, _MissingType] = Missing,
+        **kwargs,
+    ):
         super().__init_subclass__(**kwargs)
 
-        # based on dataclasses._process_class
+        # based on dataclasses._process_class, but the params of the bases
+        # are reused, so that only the annotations of this class are processed
         params: Dict[str, Param] = {}
+        for b in reversed(cls.__bases__):
+            params.update(getattr(b, "__decorator_params__", {}))
 
-        for b in cls.__mro__[-1:0:-1]:
-            base_params = getattr(b, "__decorator_params__", None)
-            if base_params:
-                for param in base_params.values():
-                    params[param.name] = param
-
-        cls_annotations = get_type_hints(cls)
+        cls_annotations = cls.__dict__.get("__annotations__", {})
         ccls = cls.mro()[1]  # the current class
         for _name, param_type in cls_annotations.items():
             if not _specialattr(_name) and not _privateattr(ccls, _name):
-                param = _get_param(cls, _name, param_type)
-                params[param.name] = param
+                params[_name] = _get_param(cls, _name, param_type)
 
         for name, value in cls.__dict__.items():
             if (
-                not _specialattr(name)
-                and not _privateattr(ccls, name)
-                and name not in cls_annotations
+                _specialattr(name)
+                or _privateattr(ccls, name)
+                or name in cls_annotations
+                # e.g. methods, unless the new default of a (callable) param
+                or (_descriptor(value) and name not in params)
             ):
+                continue
+            if name not in params:
                 raise TypeError(
                     f"{name!r} is a decorator param but has no type annotation"
                 )
 
+            # new default of an inherited param
+            params[name] = _override_param(params[name], cls)
+
+        slotted = not cls.__dictoffset__
+        if slotted:
+            for name, param in params.items():
+                setattr(cls, name, _ParamAttribute(name, param.default))
+            # instances look up the function attributes on `__func__`
+            cls.__module__ = _FunctionModule(cls.__module__)
+            cls.__doc__ = _FunctionAttribute("__doc__", cls.__doc__)
+            cls.__annotations__ = _FunctionAnnotations(cls_annotations)
+            if "__getattr__" not in cls.__dict__:
+                cls.__getattr__ = _function_getattr
+
         cls.__decorator_params__ = params
+        cls.__decorator_required__ = frozenset(
+            name for name, param in params.items() if param.default is Missing
+        )
+        cls.__decorator_resolved__ = False
+        cls.__decorator_slotted__ = slotted
+        cls.__decorator_slots__ = _declared_slots(cls)
+        cls.__decorator_passthrough__ = (
+            cls.__call_inner__ is Decorator.__call_inner__
+        )
+        cls.__set_instrumentation(instrumented, sample, profile)
+        if weak is not None:
+            cls.__decorator_weak__ = weak
+            # bound instance methods are `_WeakMethod`s, see `__get__`
+            cls.__self__ = _WEAK_SELF if weak else _SELF_SLOT
+
+    @classmethod
+    def __set_instrumentation(
+        cls,
+        instrumented: Optional[bool],
+        sample: Optional[int],
+        profile: Union[str, None, _MissingType],
+    ):
+        """Applies the class keywords of `instrumentation`, if passed."""
+        if sample is not None or not isinstance(profile, _MissingType):
+            if isinstance(profile, _MissingType):
+                profile = cls.__decorator_profile__
+            if sample is None:
+                sample = cls.__decorator_sample__
+            instrumentation.check_sampling(sample, profile)
+
+            cls.__decorator_sample__ = sample
+            cls.__decorator_profile__ = profile
+            if instrumented is None:
+                # sampling implies instrumentation
+                instrumented = True
+        if instrumented is not None:
+            cls.__decorator_instrumented__ = instrumented
 
     def __get__(
         self: Decorator[DecoratorType[FT], FT],
         instance: Optional[T],
         owner: Type[T],
     ) -> Decorator[DecoratorType[FT], FT]:
-        inner_get = getattr(self.__func_wrapped, "__get__")(instance, owner)
-        if self.__func_wrapped == inner_get:
+        try:
+            owner_binding = self.__owner_binding
+        except AttributeError:
+            # bindings are created without it
+            owner_binding = None
+        if owner_binding is not None:
+            state, binding_owner, templates, inner_states = owner_binding
+            if (
+                binding_owner is owner
+                and state is self.__bound_state
+                and (
+                    not inner_states
+                    or all(
+                        layer.__bound_state is inner_state
+                        for layer, inner_state in inner_states
+                    )
+                )
+            ):
+                return _from_templates(templates)
+
+        kind = self.__kind
+        # class- and staticmethods of the owner class are bound to it also
+        # through an instance, so the binding doesn't reference it
+        owned = (
+            (kind.is_classmethod or kind.is_staticmethod)
+            and not kind.is_bound
+            and self.__owner is not None
+            and self.__owner[0] is owner
+        )
+
+        wrapped = self.__func_wrapped
+        if type(wrapped).__get__ is _DECORATOR_GET:
+            return self.__get_stacked(instance, owner, owned)
+
+        inner_get = getattr(wrapped, "__get__")(instance, owner)
+        if wrapped == inner_get:
+            return self
+        if instance is not None and self.__decorator_weak__:
+            inner_get = _bind_weakly(inner_get, instance)
+
+        res = self.__rebind(inner_get)
+
+        if kind.is_method and not kind.is_bound:
+            if kind.is_classmethod or kind.is_staticmethod:
+                res.__bind__(owner)
+            else:
+                res.__bind__(instance or owner)
+
+            if owned:
+                self.__cache_owner_binding(owner, [self], res)
+
+        return res
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """
+        Specializes the decorator to the class in which it's defined.
+
+        Class- and staticmethods are bound to the class only once: the first
+        binding is cached, and copied on the next accesses, until an
+        attribute of the decorator changes. So `__bind__` isn't called again,
+        but each access still returns a new binding. Subclasses are bound on
+        each access, like before.
+        """
+        if hasattr(self, "__func__"):
+            # unless a partial decorator
+            _SET_OWNER(self, (owner, name))
+
+    def __get_stacked(
+        self: Decorator[DecoratorType[FT], FT],
+        instance: Optional[T],
+        owner: Type[T],
+        owned: bool,
+    ) -> Decorator[DecoratorType[FT], FT]:
+        """
+        `__get__` for directly stacked decorators, e.g. `@A @B def f`.
+
+        Instead of binding each decorator through the `__get__` of the one it
+        wraps, the innermost function is bound once, and the decorators are
+        bound from the inside out in one go; each with its own `__bind__`.
+        Class- and staticmethods are bound to the owner class. If `owned`, the
+        binding is cached while none of the layers changes, like in
+        `__get__`.
+        """
+        layers = [self]
+        wrapped = self.__func_wrapped
+        while type(wrapped).__get__ is _DECORATOR_GET:
+            layers.append(wrapped)
+            wrapped = wrapped.__func_wrapped
+
+        res = getattr(wrapped, "__get__")(instance, owner)
+        if wrapped == res:
+            # nothing to bind, e.g. a function in a class body
             return self
+        if instance is not None and layers[-1].__decorator_weak__:
+            res = _bind_weakly(res, instance)
 
-        res = self._as_bound(inner_get)
+        kind = self.__kind
+        if kind.is_classmethod or kind.is_staticmethod:
+            target = owner
+        else:
+            target = instance or owner
+        for layer in reversed(layers):
+            res = layer.__rebind(res)
+            kind = layer.__kind
+            if kind.is_method and not kind.is_bound:
+                res.__bind__(target)
 
-        if self.is_method and self.is_unbound:
-            res.__bind__(instance or owner)
+        if owned:
+            self.__cache_owner_binding(owner, layers, res)
 
         return res
 
+    def __cache_owner_binding(
+        self,
+        owner: type,
+        layers: List[Decorator],
+        binding: Decorator,
+    ):
+        """
+        Caches the binding of a class- or staticmethod to its owner class,
+        with its (stacked) `layers`, see `__get__`. It's only valid while the
+        bound states of the layers are, i.e. unless one of them has changed.
+        The binding itself is only kept as template, see `_from_templates`,
+        so that attributes set on the returned bindings aren't shared.
+        """
+        states = [layer.__bound_state for layer in layers]
+        if any(state is None or state is _PENDING for state in states):
+            # changed while binding
+            return
+
+        templates = []
+        for _ in layers:
+            templates.append(_binding_template(binding))
+            binding = binding.__func__
+
+        inner_states = tuple(zip(layers[1:], states[1:]))
+        _SET_OWNER_BINDING(self, (states[0], owner, templates, inner_states))
+
+    @property
     @final
-    def __call__(self, *args, **kwargs):
+    def __call__(self) -> Callable:
+        # the returned attribute is called directly, so that calls don't pass
+        # through an additional Python function, see `__set_call`
+        return getattr(self, self.__call_attr)
+
+    def __call_unwrapped(self, *args, **kwargs):
+        """`__call__` of partial decorators and of unbound methods."""
         if not hasattr(self, "__func__"):
             if len(args) != 1 or kwargs:
                 raise ValueError(
@@ -301,6 +592,24 @@ class Decorator(Generic[D, MaybeFT]):
 
         return self.__call_inner__(*args, **kwargs)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name != _BOUND_STATE_ATTR:
+            self.__invalidate()
+
+    def __delattr__(self, name: str) -> None:
+        super().__delattr__(name)
+        self.__invalidate()
+
+    def __invalidate(self) -> None:
+        """Discards the cached (or pending) state of `__rebind`."""
+        if self.__bound_state is None:
+            return
+
+        # waits for a pending state, so that it's discarded once it's stored
+        with _lock:
+            self.__bound_state = None
+
     def __eq__(self, other) -> bool:
         if isinstance(other, Decorator):
             if self.function_type is not other.function_type:
@@ -344,82 +653,266 @@ class Decorator(Generic[D, MaybeFT]):
 
     def __ge__(self, other) -> bool:
         self.__typecheck_order_operator_param(other, ">=")
-        return self == other or self > other
+        # explicit calls, so that e.g. a `__gt__` of a subclass isn't skipped
+        return self.__eq__(other) or self.__gt__(other)
 
     def __lt__(self, other) -> bool:
         self.__typecheck_order_operator_param(other, "<")
-        return other > self
+        return other.__gt__(self)
 
     def __le__(self, other) -> bool:
         self.__typecheck_order_operator_param(other, "<=")
-        return self == other or self < other
+        return self.__eq__(other) or self.__lt__(other)
 
     def __repr__(self):
         type_str = str(self.function_type)
 
-        if (instance := getattr(self, "__self__", None)) is not None:
+        try:
+            instance = getattr(self, "__self__", None)
+        except ReferenceError:
+            # weak decorator, see `_WeakMethod`
+            instance = "<collected>"
+        if instance is not None:
             type_str = f"{type_str} of {instance}"
 
         return f"<{type_str}>"
 
     __str__ = __repr__
 
+    def __reduce__(self):
+        """
+        Decorators are pickled by reference, like functions, together with
+        their param values. When unpickled, the decorator is looked up by its
+        module and qualified name, or bound again to the pickled instance or
+        class. So `__decorate__` isn't called again; if the param values
+        differ, a copy with the pickled param values is returned.
+        """
+        params = {
+            name: getattr(self, name)
+            for name in self.__decorator_params__
+            if hasattr(self, name)
+        }
+        if not hasattr(self, "__func__"):
+            return functools.partial(type(self), **params), ()
+
+        function = getattr(self.__func__, "__func__", self.__func__)
+        if (owner := getattr(self, "__self__", None)) is not None:
+            # bound instance or class method
+            return _unpickle_bound, (owner, function.__name__, params)
+
+        try:
+            owner, name = _find_owner(
+                function.__module__, function.__qualname__
+            )
+            unbound = vars(owner)[name]
+        except (ImportError, AttributeError, KeyError, TypeError):
+            unbound = None
+
+        if unbound is self:
+            return _unpickle, (
+                function.__module__, function.__qualname__, params
+            )
+        if isinstance(unbound, Decorator) and unbound > self:
+            # bound staticmethod
+            return _unpickle_bound, (owner, name, params)
+
+        import pickle
+
+        raise pickle.PicklingError(
+            f"Can't pickle {self!r}: it's not found as "
+            f"{function.__module__}.{function.__qualname__}"
+        )
+
+    def __copy__(self):
+        """
+        Decorators aren't copied, like functions; otherwise `__reduce__`
+        would look them up by reference.
+        """
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]):
+        return self
+
     @final
-    @functools.cached_property
-    def is_function(self):
-        return self.function_type is FunctionType.FUNCTION
+    def batch(self, args_list: Iterable[Tuple[Any, ...]], /) -> List[Any]:
+        """
+        Calls the decorated function with each of the argument tuples, and
+        returns the results as list; `[f(*args) for args in args_list]`.
+        """
+        self.__typecheck_callable()
+        if not isinstance(args_list, list):
+            args_list = list(args_list)
+        return self.__call_batch__(args_list)
 
     @final
-    @functools.cached_property
-    def is_method(self):
-        return self.function_type in FunctionType.METHOD
+    def map(
+        self, iterable: Iterable[Tuple[Any, ...]], /, chunksize: int = 1024
+    ) -> Iterator[Any]:
+        """
+        Lazy variant of `batch`, like `itertools.starmap`; the argument tuples
+        are called in batches of at most `chunksize`.
+        """
+        self.__typecheck_callable()
+        if chunksize < 1:
+            raise ValueError("chunksize must be at least 1")
+
+        iterator = iter(iterable)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+        return itertools.chain.from_iterable(map(self.__call_batch__, chunks))
+
+    @overload
+    @classmethod
+    def apply_to_class(
+        cls,
+        target: C,
+        /,
+        *,
+        include: Optional[Iterable[str]] = None,
+        exclude: Iterable[str] = (),
+        **params,
+    ) -> C:
+        ...  # pragma: no cover
+
+    @overload
+    @classmethod
+    def apply_to_class(
+        cls,
+        target: None = None,
+        /,
+        *,
+        include: Optional[Iterable[str]] = None,
+        exclude: Iterable[str] = (),
+        **params,
+    ) -> Callable[[C], C]:
+        ...  # pragma: no cover
+
+    @classmethod
+    def apply_to_class(
+        cls,
+        target: Optional[C] = None,
+        /,
+        *,
+        include: Optional[Iterable[str]] = None,
+        exclude: Iterable[str] = (),
+        **params,
+    ) -> Union[C, Callable[[C], C]]:
+        """
+        Decorates the methods, classmethods and staticmethods that are defined
+        in the class body of `target`, with the decorator params, and returns
+        the class. Without `target`, a class decorator is returned.
+
+        The methods are selected by their name: those that match any of the
+        `include` patterns (`fnmatch`-style, by default all public names),
+        and none of the `exclude` patterns. Methods that are already
+        decorated by a `Decorator` are skipped.
+
+        Class- and staticmethods are known from the class body. Like when
+        decorated separately, other functions are instance methods if their
+        first parameter is named `self`.
+        """
+        if target is None:
+            return cast(
+                Callable[[C], C],
+                functools.partial(
+                    cls.apply_to_class,
+                    include=include,
+                    exclude=exclude,
+                    **params,
+                ),
+            )
+
+        # checks the params once; a partial decorator has no side effects
+        partial = cls(**params)
+        param_values = {
+            name: getattr(partial, name)
+            for name in cls.__decorator_params__
+            if hasattr(partial, name)
+        }
+
+        for name, member in _select_members(target, include, exclude):
+            function_type: Optional[FunctionType]
+            if isinstance(member, classmethod):
+                function_type = FunctionType.CLASSMETHOD_UNBOUND
+            elif isinstance(member, staticmethod):
+                function_type = FunctionType.STATICMETHOD_UNBOUND
+            else:
+                # see `get_function_type`
+                function_type = None
+
+            decorator = cls(
+                member,
+                _param_values=dict(param_values),
+                _function_type=function_type,
+            )
+            setattr(target, name, decorator)
+            decorator.__set_name__(target, name)
+
+        return target
 
     @final
-    @functools.cached_property
-    def is_instancemethod(self):
-        return self.function_type in FunctionType.INSTANCEMETHOD
+    @property
+    def is_function(self) -> bool:
+        return self.__kind.function_type is FunctionType.FUNCTION
 
     @final
-    @functools.cached_property
-    def is_classmethod(self):
-        return self.function_type in FunctionType.CLASSMETHOD
+    @property
+    def is_method(self) -> bool:
+        return self.__kind.is_method
 
     @final
-    @functools.cached_property
-    def is_staticmethod(self):
-        return self.function_type in FunctionType.STATICMETHOD
+    @property
+    def is_instancemethod(self) -> bool:
+        return self.__kind.is_instancemethod
 
     @final
-    @functools.cached_property
-    def is_unbound(self):
-        if not self.is_method:
+    @property
+    def is_classmethod(self) -> bool:
+        return self.__kind.is_classmethod
+
+    @final
+    @property
+    def is_staticmethod(self) -> bool:
+        return self.__kind.is_staticmethod
+
+    @final
+    @property
+    def is_unbound(self) -> bool:
+        if not self.__kind.is_method:
             raise TypeError("not a method")
-        return self.function_type in FunctionType.METHOD_UNBOUND
+        return not self.__kind.is_bound
 
     @final
-    @functools.cached_property
-    def is_bound(self):
-        if not self.is_method:
+    @property
+    def is_bound(self) -> bool:
+        if not self.__kind.is_method:
             raise TypeError("not a method")
-        return self.function_type in FunctionType.METHOD_BOUND
+        return self.__kind.is_bound
 
     @final
-    @functools.cached_property
-    def function_type(self) -> FunctionType:
-        if self.__unbound_function_type:
-            return self.__unbound_function_type.as_bound()
-        else:
-            return get_function_type(self.__func_wrapped)
+    @property
+    def is_coroutinefunction(self) -> bool:
+        return self.__kind.is_coroutinefunction
 
     @final
-    @functools.cached_property
-    def _required_params(self) -> FrozenSet[str]:
-        res: Set[str] = set()
-        for name, param in self.__decorator_params__.items():
-            if param.default is Missing:
-                res.add(name)
+    @property
+    def is_generatorfunction(self) -> bool:
+        return self.__kind.is_generatorfunction
+
+    @final
+    @property
+    def is_asyncgenfunction(self) -> bool:
+        return self.__kind.is_asyncgenfunction
 
-        return frozenset(res)
+    @final
+    @property
+    def function_type(self) -> FunctionType:
+        return self.__kind.function_type
+
+    def __typecheck_callable(self):
+        if not hasattr(self, "__func__"):
+            raise TypeError(f"'{type(self).__name__}' decorator is partial")
+        if self.function_type in FunctionType.METHOD_UNBOUND:
+            raise TypeError(f"'{self}' object is not callable")
 
     @classmethod
     def __typecheck_order_operator_param(cls, other, operator: str):
@@ -455,45 +948,157 @@ class Decorator(Generic[D, MaybeFT]):
             _decorate=partial,
         )
 
-        # persistant attributes
-        for name, value in self.__dict__.items():
-            if (
-                not _specialattr(name)
-                and not _privateattr(type(self), name)
-                and not hasattr(res, name)
-            ):
-                setattr(res, name, value)
-
+        _copy_attributes(self, res)
         return cast(Decorator[DecoratorType[FT], FT], res)
 
-    def __set_function(self, function):
+    def __rebind(
+        self: Decorator[DecoratorType[FT], FT], bound: FT
+    ) -> Decorator[DecoratorType[FT], FT]:
+        """
+        Equivalent to `_as_bound(bound)` for the result of `__get__`.
+
+        Apart from the bound function itself, a binding doesn't depend on the
+        instance or owner it's bound to, so the state of the first binding is
+        reused for the next ones. No reference to the instance or owner is
+        kept, and setting or deleting an attribute of this decorator
+        invalidates the cached state.
+
+        The state is created while holding `_lock`, and marked as pending
+        meanwhile. Concurrent bindings wait for it, and concurrent attribute
+        changes discard it once it's stored, see `__invalidate`.
+        """
+        bound_state = self.__bound_state
+        if bound_state is None or bound_state is _PENDING:
+            with _lock:
+                bound_state = self.__bound_state
+                if bound_state is None:
+                    self.__bound_state = _PENDING
+                    return self.__cache_bound_state(bound)
+                if bound_state is _PENDING:
+                    # re-entered while creating the state
+                    return self._as_bound(bound)
+
+        cls, slots, instance_state = bound_state
+        res = object.__new__(cls)
+        for set_slot, value in slots:
+            set_slot(res, value)
+        _SET_FUNC_WRAPPED(res, bound)
+        _SET_FUNC(res, bound)
+        if cls.__decorator_weak__:
+            # looked up through `__func__`, see `_WEAK_SELF`
+            pass
+        elif (_self := getattr(bound, "__self__", None)) is not None:
+            _SET_SELF(res, _self)
+        if not cls.__decorator_slotted__:
+            res_dict = res.__dict__
+            res_dict.update(_function_state(res, bound))
+            res_dict.update(instance_state)
+            res_dict["__wrapped__"] = bound
+
+        return res
+
+    def __cache_bound_state(
+        self: Decorator[DecoratorType[FT], FT], bound: FT
+    ) -> Decorator[DecoratorType[FT], FT]:
+        try:
+            res = self._as_bound(bound)
+        except BaseException:
+            self.__bound_state = None
+            raise
+
+        # slot setters with their values, and `__dict__` items
+        slots = [
+            (_set_slot(type(res), name), getattr(res, name))
+            for name in _STATE_ATTRS
+            if hasattr(res, name)
+        ]
+        # the attributes that `__update_wrapper` copies from the bound
+        # function (e.g. a binding of a stacked decorator) can differ between
+        # bindings, so these are copied again in `__rebind`, unless params
+        inner_state = _function_state(res, bound)
+        instance_state = {
+            name: value
+            for name, value in _instance_state(res).items()
+            if name not in _BINDING_ATTRS
+            and (name not in inner_state or name in self.__decorator_params__)
+        }
+        if type(res).__decorator_slotted__:
+            slots += [
+                (_set_slot(type(res), name), value)
+                for name, value in instance_state.items()
+            ]
+            instance_state = {}
+        if self.__bound_state is _PENDING:
+            # unless invalidated meanwhile
+            self.__bound_state = type(res), slots, instance_state
+        return res
+
+    def __set_function(
+        self, function, function_type: Optional[FunctionType] = None
+    ):
         self.__func_wrapped = function
 
-        # verbose nested conditions for mypy-compatibility
-        if isinstance(function, ClassMethodDescriptor):
-            if callable(function):
-                self.__func__ = function
-            else:
-                self.__func__ = function.__func__
-        else:
+        if callable(function):
             self.__func__ = function
+        else:
+            # a class- or staticmethod, see `is_decoratable`; this avoids the
+            # (slow) `isinstance` check of the `ClassMethodDescriptor` protocol
+            self.__func__ = function.__func__
+
+        if self.__unbound_function_type:
+            function_type = self.__unbound_function_type.as_bound()
+        elif function_type is None:
+            if isinstance(function, Decorator):
+                # stacked, so of the kind of the innermost descriptor, e.g. a
+                # classmethod, which isn't known from the signature
+                function_type = function.function_type
+            else:
+                function_type = get_function_type(function)
+        self.__kind = _function_kind(function_type, function)
+
+        _self = getattr(self.__func__, "__self__", None)
+        if _self is not None and not self.__decorator_weak__:
+            self.__self__ = _self
+        if not self.__decorator_slotted__:
+            self.__update_wrapper()
 
+        if self.is_method and self.is_bound:
+            if self.is_classmethod:
+                assert isinstance(_self, type)
+
+            elif self.is_instancemethod:
+                assert not isinstance(_self, type)
+
+        if type(self).__decorator_instrumented__:
+            self.__call_stats = instrumentation.get_stats(
+                type(self), self.__func__, function_type
+            )
+
+        self.__set_call()
+
+    def __update_wrapper(self):
+        """Copies the attributes of the function, unless slotted."""
         # verbose variant for functools.update_wrapper for mypy-compatibilty
         self.__module__ = self.__func__.__module__
         self.__name__ = self.__func__.__name__
         self.__qualname__ = self.__func__.__qualname__
         self.__doc__ = self.__func__.__doc__
         self.__annotations__ = self.__func__.__annotations__
-        if (_self := getattr(self.__func__, "__self__", None)) is not None:
-            self.__self__ = _self
+        self.__wrapped__ = self.__func__
+        # function-like, so that e.g. `inspect.iscoroutinefunction` works
+        inner_func = getattr(self.__func__, "__func__", self.__func__)
+        for name in _CODE_ATTRS:
+            if (value := getattr(inner_func, name, Missing)) is not Missing:
+                setattr(self, name, value)
         self.__dict__.update(self.__func__.__dict__)
 
-        if self.is_method and self.is_bound:
-            if self.is_classmethod:
-                assert isinstance(self.__self__, type)
-
-            elif self.is_instancemethod:
-                assert not isinstance(self.__self__, type)
+    def __set_call(self):
+        """Sets the attributes that `__call__` returns, see `_call_attrs`."""
+        if not self.is_method or self.is_bound:
+            self.__call_attr, self.__call_target = _call_attrs(self)
+        else:
+            self.__call_attr = _CALL_UNWRAPPED_ATTR
+            self.__call_target = None
 
     # The following methods are meant for overriding
     def __decorate__(self, **kwargs) -> NoReturn:
@@ -505,11 +1110,639 @@ class Decorator(Generic[D, MaybeFT]):
     def __call_inner__(self, *args, **kwargs) -> Any:
         return self.__func__(*args, **kwargs)
 
+    async def __call_inner_async__(self, *args, **kwargs) -> Any:
+        return await self.__func__(*args, **kwargs)
+
+    def __yield_inner__(self, item: Any) -> Any:
+        return item
+
+    def __call_batch__(self, args_list: Sequence[Tuple[Any, ...]]) -> List:
+        # calls whatever `__call__` returns, so that there is no per-call
+        # overhead within the loop
+        return list(itertools.starmap(self.__call__, args_list))
+
+    # used instead of __call_inner__ if __yield_inner__ is overridden
+    def __call_generator(self, *args, **kwargs) -> Generator:
+        return _map_generator(
+            self.__call_inner__(*args, **kwargs), self.__yield_inner__
+        )
+
+    def __call_asyncgen(self, *args, **kwargs) -> AsyncGenerator:
+        return _map_asyncgen(
+            self.__call_inner__(*args, **kwargs), self.__yield_inner__
+        )
+
+    # used for instrumented decorators, these call the `__call_target`,
+    # and record 1 in `CallStats.sample` calls
+    def __call_instrumented(self, *args, **kwargs) -> Any:
+        call = getattr(self, self.__call_target)
+        stats = self.__call_stats
+        stats.countdown -= 1
+        if stats.countdown > 0:
+            return call(*args, **kwargs)
+
+        stats.countdown = stats.sample
+        if stats.profile is not None:
+            return stats.record_profiled(call, args, kwargs)
+        start = time.perf_counter_ns()
+        try:
+            res = call(*args, **kwargs)
+        except BaseException:
+            stats.record(time.perf_counter_ns() - start, True)
+            raise
+        stats.record(time.perf_counter_ns() - start)
+        return res
+
+    async def __call_instrumented_async(self, *args, **kwargs) -> Any:
+        call = getattr(self, self.__call_target)
+        stats = self.__call_stats
+        stats.countdown -= 1
+        if stats.countdown > 0:
+            return await call(*args, **kwargs)
+
+        # not profiled, since other tasks run while it's awaited
+        stats.countdown = stats.sample
+        start = time.perf_counter_ns()
+        try:
+            res = await call(*args, **kwargs)
+        except BaseException:
+            stats.record(time.perf_counter_ns() - start, True)
+            raise
+        stats.record(time.perf_counter_ns() - start)
+        return res
+
+
+_DECORATOR_GET: Final = Decorator.__get__
+_FUNC_WRAPPED_ATTR: Final = "_Decorator__func_wrapped"
+_BOUND_STATE_ATTR: Final = "_Decorator__bound_state"
+_UNBOUND_FUNCTION_TYPE_ATTR: Final = "_Decorator__unbound_function_type"
+# private attributes that are the same for all bindings of a decorator
+_STATE_ATTRS: Final = (
+    _BOUND_STATE_ATTR,
+    "_Decorator__kind",
+    _UNBOUND_FUNCTION_TYPE_ATTR,
+    "_Decorator__param_values",
+    "_Decorator__call_stats",
+    "_Decorator__call_attr",
+    "_Decorator__call_target",
+)
+# instance attributes that differ between bindings of the same decorator
+_BINDING_ATTRS: Final = frozenset({"__wrapped__"})
+# setters of the slots of `Decorator`, which bypass `Decorator.__setattr__`
+_SET_FUNC_WRAPPED: Final = Decorator.__dict__[_FUNC_WRAPPED_ATTR].__set__
+_SET_FUNC: Final = Decorator.__dict__["__func__"].__set__
+_SELF_SLOT: Final = Decorator.__dict__["__self__"]
+_SET_SELF: Final = _SELF_SLOT.__set__
+# `__self__` of weak decorators, which bind instance methods as `_WeakMethod`
+_WEAK_SELF: Final = property(operator.attrgetter("__func__.__self__"))
+_SET_OWNER: Final = Decorator.__dict__["_Decorator__owner"].__set__
+_SET_OWNER_BINDING: Final = Decorator.__dict__[
+    "_Decorator__owner_binding"
+].__set__
+_CODE_ATTRS: Final = ("__code__", "__defaults__", "__kwdefaults__")
+_CALL_UNWRAPPED_ATTR: Final = "_Decorator__call_unwrapped"
+# the (mangled) slots of `Decorator`, apart from `__weakref__`
+_DECORATOR_SLOTS: Final = tuple(
+    name if name.endswith("__") else f"_Decorator{name}"
+    for name in Decorator.__slots__
+    if name != "__weakref__"
+)
+# marks the bound state that is being created, see `Decorator.__rebind`
+_PENDING: Final = object()
+# guards the creation of bound states and the resolution of params
+_lock: Final = threading.RLock()
+
+
+class _FunctionKind(NamedTuple):
+    """The classification of a decorated function, shared by decorators."""
+
+    function_type: FunctionType
+    is_method: bool
+    is_instancemethod: bool
+    is_classmethod: bool
+    is_staticmethod: bool
+    is_bound: bool
+    is_coroutinefunction: bool
+    is_generatorfunction: bool
+    is_asyncgenfunction: bool
+
+
+# (function type, coroutine, generator, async generator) => kind
+_function_kinds: Dict[Tuple[FunctionType, bool, bool, bool], _FunctionKind]
+_function_kinds = {}
+
+
+def _function_kind(
+    function_type: FunctionType, function: Any
+) -> _FunctionKind:
+    key = (
+        function_type,
+        is_coroutinefunction(function),
+        is_generatorfunction(function),
+        is_asyncgenfunction(function),
+    )
+    if (kind := _function_kinds.get(key)) is None:
+        kind = _function_kinds.setdefault(
+            key,
+            _FunctionKind(
+                function_type,
+                function_type in FunctionType.METHOD,
+                function_type in FunctionType.INSTANCEMETHOD,
+                function_type in FunctionType.CLASSMETHOD,
+                function_type in FunctionType.STATICMETHOD,
+                function_type in FunctionType.METHOD_BOUND,
+                *key[1:],
+            ),
+        )
+    return kind
+
+
+class _ParamAttribute:
+    """
+    Param of a slotted decorator. The param values are stored in a dict that
+    is shared by the bindings of the decorator, so it's replaced instead of
+    changed when a param is set.
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: Any):
+        self.name = name
+        self.default = default
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            if self.default is Missing:
+                raise AttributeError(self.name)
+            return self.default
+
+        try:
+            return instance._Decorator__param_values[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, instance, value):
+        values = dict(instance._Decorator__param_values)
+        values[self.name] = value
+        instance._Decorator__param_values = values
+
+    def __delete__(self, instance):
+        values = dict(instance._Decorator__param_values)
+        if values.pop(self.name, Missing) is Missing:
+            raise AttributeError(self.name)
+        instance._Decorator__param_values = values
+
+
+class _FunctionAttribute:
+    """
+    Attribute of the decorated function, for slotted decorators. On the
+    class itself, and on partial decorators, `class_value` is returned
+    instead.
+    """
+
+    __slots__ = ("name", "class_value")
+
+    def __init__(self, name: str, class_value: Any):
+        self.name = name
+        self.class_value = class_value
+
+    def __get__(self, instance, owner=None):
+        function = getattr(instance, "__func__", Missing)
+        if function is Missing:
+            return self.class_value
+        return getattr(function, self.name)
+
+
+class _FunctionModule(str):
+    """
+    `_FunctionAttribute` for `__module__`, which is a str on the class itself.
+    """
+
+    def __get__(self, instance, owner=None):
+        function = getattr(instance, "__func__", Missing)
+        if function is Missing:
+            return self
+        return function.__module__
+
+
+class _FunctionAnnotations(dict):
+    """
+    `_FunctionAttribute` for `__annotations__`, which is a dict on the class
+    itself, e.g. for `typing.get_type_hints`.
+    """
+
+    def __get__(self, instance, owner=None):
+        function = getattr(instance, "__func__", Missing)
+        if function is Missing:
+            return self
+        return function.__annotations__
+
+
+class _WeakMethod:
+    """
+    Bound method that references its instance weakly, for the bindings of
+    weak decorators. Once the instance is garbage collected, calling it or
+    getting its `__self__` raises `ReferenceError`. Other attributes are
+    looked up on the function, like those of `types.MethodType`.
+    """
+
+    __slots__ = ("__func__", "_ref")
+
+    __module__ = _FunctionModule(__name__)
+    __doc__ = _FunctionAttribute("__doc__", __doc__)
+
+    def __init__(self, function: Callable, instance: Any):
+        self.__func__ = function
+        self._ref = weakref.ref(instance)
+
+    @property
+    def __self__(self) -> Any:
+        if (instance := self._ref()) is None:
+            raise ReferenceError(
+                f"the instance of weakly bound method "
+                f"{self.__func__.__qualname__} no longer exists"
+            )
+        return instance
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.__func__(self.__self__, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(object.__getattribute__(self, "__func__"), name)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, _WeakMethod):
+            return NotImplemented
+        # without callback, the weakrefs to an instance are the same object
+        return self.__func__ == other.__func__ and self._ref is other._ref
+
+    def __hash__(self) -> int:
+        return hash((self.__func__, id(self._ref)))
+
+    def __repr__(self):
+        instance = self._ref()
+        target = "<collected>" if instance is None else repr(instance)
+        return (
+            f"<weakly bound method {self.__func__.__qualname__} of {target}>"
+        )
+
+
+def _bind_weakly(bound: Any, instance: Any) -> Any:
+    """
+    Replaces a method bound to `instance` with a `_WeakMethod`; anything
+    else, e.g. a classmethod bound to its class, is returned as is.
+    """
+    if type(bound) is not types.MethodType or bound.__self__ is not instance:
+        return bound
+
+    try:
+        return _WeakMethod(bound.__func__, instance)
+    except TypeError:
+        raise TypeError(
+            f"cannot bind {bound.__func__.__qualname__} weakly to "
+            f"'{type(instance)}', because it doesn't support weak references"
+        ) from None
+
+
+def _function_getattr(decorator: Decorator, name: str) -> Any:
+    """
+    `__getattr__` of slotted decorators, for the attributes that other
+    decorators copy from the decorated function.
+    """
+    function = object.__getattribute__(decorator, "__func__")
+    if name == "__wrapped__":
+        return function
+    elif name in _CODE_ATTRS:
+        return getattr(getattr(function, "__func__", function), name)
+    elif name in {"__name__", "__qualname__"} or name in getattr(
+        function, "__dict__", ()
+    ):
+        return getattr(function, name)
+
+    raise AttributeError(
+        f"'{type(decorator).__name__}' object has no attribute '{name}'"
+    )
+
+
+def _set_slot(cls: type, name: str) -> Callable[[Any, Any], None]:
+    """Returns the setter of a slot, which bypasses `__setattr__`."""
+    for b in cls.__mro__:
+        if name in b.__dict__:
+            return b.__dict__[name].__set__
+    raise AttributeError(name)  # pragma: no cover
+
+
+def _declared_slots(cls: Type[Decorator]) -> Tuple[str, ...]:
+    """The (mangled) `__slots__` of a decorator class and its bases."""
+    res: List[str] = []
+    for b in cls.__mro__:
+        if b is Decorator:
+            break
+
+        slots = b.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in {"__dict__", "__weakref__"}:
+                continue
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{b.__name__.lstrip('_')}{name}"
+            res.append(name)
+
+    return tuple(res)
+
+
+def _instance_state(decorator: Decorator) -> Dict[str, Any]:
+    """The instance attributes, apart from those of `Decorator` itself."""
+    res = {}
+    for name in type(decorator).__decorator_slots__:
+        try:
+            res[name] = object.__getattribute__(decorator, name)
+        except AttributeError:
+            pass
+
+    if not type(decorator).__decorator_slotted__:
+        res.update(decorator.__dict__)
+    return res
+
+
+def _get_scoped(
+    decorator: Decorator,
+    instance_or_class: Any,
+    scopes: Dict[int, Tuple[weakref.ref, S]],
+    factory: Callable[[], S],
+    action: str,
+) -> S:
+    """
+    Returns the state of a method binding that is kept per instance, or per
+    class for classmethods, e.g. a cache. It's created by `factory` when the
+    instance or class is first bound, and stored in `scopes` by its id until
+    it's garbage collected.
+    """
+    # classmethods can also be bound through an instance
+    target = (
+        decorator.__self__ if decorator.is_classmethod else instance_or_class
+    )
+
+    key = id(target)
+    entry = scopes.get(key)
+    if entry is None:
+        try:
+            ref = weakref.ref(target, lambda _: scopes.pop(key, None))
+        except TypeError:
+            raise TypeError(
+                f"cannot {action} {decorator} of '{type(target)}', because "
+                f"it doesn't support weak references"
+            ) from None
+
+        # another binding may have created one meanwhile
+        entry = scopes.setdefault(key, (ref, factory()))
+
+    return entry[1]
+
+
+# class, slot setters with their values, and `__dict__` of a binding
+_Template = Tuple[type, List[Tuple[Callable[[Any, Any], None], Any]], Any]
+
+
+def _binding_template(binding: Decorator) -> _Template:
+    """The state of a binding to copy, see `_from_templates`."""
+    cls = type(binding)
+    slots = []
+    for name in _DECORATOR_SLOTS:
+        # not through the class, which can override e.g. `__self__`
+        slot = Decorator.__dict__[name]
+        try:
+            slots.append((slot.__set__, slot.__get__(binding)))
+        except AttributeError:
+            pass
+    for name in cls.__decorator_slots__:
+        try:
+            value = object.__getattribute__(binding, name)
+        except AttributeError:
+            continue
+        slots.append((_set_slot(cls, name), value))
 
-def _get_param(cls: Type[Decorator], name: str, tp: Type[PT]) -> Param[PT]:
+    state = None if cls.__decorator_slotted__ else dict(binding.__dict__)
+    return cls, slots, state
+
+
+def _from_templates(templates: List[_Template]) -> Decorator:
+    """
+    Returns a new binding from the templates of its (stacked) layers, from the
+    outermost to the innermost. Each layer wraps a copy of the next one.
+    """
+    res = None
+    for cls, slots, state in reversed(templates):
+        inner, res = res, object.__new__(cls)
+        for set_slot, value in slots:
+            set_slot(res, value)
+        if inner is not None:
+            _SET_FUNC_WRAPPED(res, inner)
+            _SET_FUNC(res, inner)
+        if state is not None:
+            res_dict = res.__dict__
+            res_dict.update(state)
+            if inner is not None:
+                res_dict["__wrapped__"] = inner
+
+    assert res is not None
+    return res
+
+
+def _function_state(decorator: Decorator, function: Any) -> Dict[str, Any]:
+    """
+    The attributes of the decorated function that are copied to a decorator
+    without slots, see `Decorator.__update_wrapper`.
+    """
+    if type(decorator).__decorator_slotted__:
+        return {}
+    return getattr(function, "__dict__", {})
+
+
+def _call_attrs(decorator: Decorator) -> Tuple[str, Optional[str]]:
+    """
+    Returns the names of the attribute that `Decorator.__call__` returns for
+    a callable decorator, i.e. a decorated function or bound method, and of
+    the attribute that is called by the instrumented ones.
+
+    That's the bound `__call_inner__`, which is called directly, so calls
+    don't pass through an additional Python function.
+    If `__call_inner__` isn't overridden, it's `__func__` instead, so that
+    calls go straight to the wrapped function.
+    For coroutine functions, `__call_inner_async__` is used if overridden.
+    For (async) generator functions, the yielded items are passed through
+    `__yield_inner__` if overridden.
+    For instrumented decorator classes, the call is wrapped in one that
+    records its duration; for generator functions only the creation of the
+    generator is timed.
+    """
+    cls = type(decorator)
+
+    if decorator.is_coroutinefunction and _overrides(
+        cls, "__call_inner_async__"
+    ):
+        call_attr = "__call_inner_async__"
+    elif decorator.is_generatorfunction and _overrides(cls, "__yield_inner__"):
+        call_attr = "_Decorator__call_generator"
+    elif decorator.is_asyncgenfunction and _overrides(cls, "__yield_inner__"):
+        call_attr = "_Decorator__call_asyncgen"
+    elif cls.__decorator_passthrough__:
+        call_attr = "__func__"
+    else:
+        call_attr = "__call_inner__"
+
+    if not cls.__decorator_instrumented__:
+        return call_attr, None
+    if decorator.is_coroutinefunction:
+        return "_Decorator__call_instrumented_async", call_attr
+    return "_Decorator__call_instrumented", call_attr
+
+
+def _overrides(cls: Type[Decorator], name: str) -> bool:
+    return getattr(cls, name) is not getattr(Decorator, name)
+
+
+def _map_generator(
+    generator: Generator, function: Callable[[Any], Any]
+) -> Generator:
+    """
+    Equivalent to `yield from generator`, but yields `function(item)` for each
+    item; sent values, exceptions and closing are forwarded to the generator.
+    """
+    # based on the `yield from` semantics of PEP 380
+    try:
+        item = next(generator)
+    except StopIteration as e:
+        return e.value
+
+    while True:
+        try:
+            sent = yield function(item)
+        except GeneratorExit:
+            generator.close()
+            raise
+        except BaseException as e:
+            try:
+                item = generator.throw(e)
+            except StopIteration as stop:
+                return stop.value
+        else:
+            try:
+                item = generator.send(sent)
+            except StopIteration as stop:
+                return stop.value
+
+
+async def _map_asyncgen(
+    generator: AsyncGenerator, function: Callable[[Any], Any]
+) -> AsyncGenerator:
+    """The async generator equivalent of `_map_generator`."""
+    try:
+        item = await generator.__anext__()
+    except StopAsyncIteration:
+        return
+
+    while True:
+        try:
+            sent = yield function(item)
+        except GeneratorExit:
+            await generator.aclose()
+            raise
+        except BaseException as e:
+            try:
+                item = await generator.athrow(e)
+            except StopAsyncIteration:
+                return
+        else:
+            try:
+                item = await generator.asend(sent)
+            except StopAsyncIteration:
+                return
+
+
+def _select_members(
+    target: type, include: Optional[Iterable[str]], exclude: Iterable[str]
+) -> List[Tuple[str, Any]]:
+    """The functions in the class body to decorate, see `apply_to_class`."""
+    from fnmatch import fnmatchcase
+
+    include = ["[!_]*"] if include is None else list(include)
+    exclude = list(exclude)
+
+    return [
+        (name, member)
+        for name, member in vars(target).items()
+        if isinstance(member, (types.FunctionType, classmethod, staticmethod))
+        and any(fnmatchcase(name, pattern) for pattern in include)
+        and not any(fnmatchcase(name, pattern) for pattern in exclude)
+    ]
+
+
+def _find_owner(module: str, qualname: str) -> Tuple[Any, str]:
+    """
+    Returns the module or class in which the qualified name is defined, and
+    the name within it.
+    """
+    __import__(module)
+    owner: Any = sys.modules[module]
+    *path, name = qualname.split(".")
+    for part in path:
+        owner = getattr(owner, part)
+    return owner, name
+
+
+def _unpickle(module: str, qualname: str, params: Dict[str, Any]):
+    owner, name = _find_owner(module, qualname)
+    return _with_params(vars(owner)[name], params)
+
+
+def _unpickle_bound(owner: Any, name: str, params: Dict[str, Any]):
+    return _with_params(getattr(owner, name), params)
+
+
+def _with_params(decorator: Decorator, params: Dict[str, Any]) -> Decorator:
+    """
+    Returns the decorator if its param values are the same, otherwise a copy
+    with the param values, without calling `__decorate__`.
+    """
+    param_values = {
+        name: getattr(decorator, name)
+        for name in decorator.__decorator_params__
+        if hasattr(decorator, name)
+    }
+    if param_values == params:
+        return decorator
+
+    res = type(decorator)(
+        getattr(decorator, _FUNC_WRAPPED_ATTR),
+        _unbound_function_type=getattr(decorator, _UNBOUND_FUNCTION_TYPE_ATTR),
+        _param_values={**param_values, **params},
+        _decorate=False,
+    )
+    _copy_attributes(decorator, res)
+    return res
+
+
+def _copy_attributes(decorator: Decorator, res: Decorator):
+    """Copies the persistent instance attributes of a decorator."""
+    for name, value in _instance_state(decorator).items():
+        if (
+            not _specialattr(name)
+            and not _privateattr(type(decorator), name)
+            and not _privateattr(Decorator, name)
+            and not hasattr(res, name)
+        ):
+            setattr(res, name, value)
+
+
+def _get_param(
+    cls: Type[Decorator],
+    name: str,
+    tp: Union[Type[PT], str],
+    default_cls: Optional[Type[Decorator]] = None,
+) -> Param[PT]:
     # based on decorators._get_field
 
-    default = getattr(cls, name, Missing)
+    default: Any = getattr(default_cls or cls, name, Missing)
     if isinstance(default, Param):  # pragma: no cover
         # TODO fix this
         param = default
@@ -521,16 +1754,114 @@ def _get_param(cls: Type[Decorator], name: str, tp: Type[PT]) -> Param[PT]:
 
     param.name = name
     param.type = tp
-
-    if default is not Missing and param.is_of_type(default) is False:
-        raise TypeError(
-            f"type of decorator parameter default '{param.name}' must be "
-            f"'{param.type}'; got '{type(default)}' instead"
-        )
+    param.owner = cls
+    if not isinstance(tp, str):
+        param.resolve()
 
     return param
 
 
+def _override_param(param: Param[PT], cls: Type[Decorator]) -> Param[PT]:
+    """Returns an inherited param, with its default in the subclass."""
+    owner, name, tp = param.owner, param.name, param.type
+    # inherited params are complete, see `_get_param`
+    assert not isinstance(owner, _MissingType)
+    assert not isinstance(name, _MissingType)
+    assert not isinstance(tp, _MissingType)
+    return _get_param(owner, name, tp, default_cls=cls)
+
+
+def _resolve_params(cls: Type[Decorator]):
+    with _lock:
+        if cls.__decorator_resolved__:
+            return
+        for param in cls.__decorator_params__.values():
+            param.resolve()
+        cls.__decorator_resolved__ = True
+
+
+# type => checker function, see `_type_checker`
+_type_checkers: Dict[Any, Callable[[Any], Optional[bool]]] = {}
+_UNION_TYPES: Final = frozenset({Union, getattr(types, "UnionType", Union)})
+# implicit PEP 484 numeric promotions, as supported by typeguard
+_NUMERIC_TOWER: Final = {float: (int,), complex: (float, int)}
+
+
+def _type_checker(tp: Any) -> Callable[[Any], Optional[bool]]:
+    """
+    Returns a (cached) function that checks whether its argument is of the
+    type, and returns None if that could not be determined.
+    """
+    try:
+        return _type_checkers[tp]
+    except KeyError:
+        return _type_checkers.setdefault(tp, _compile_type_checker(tp))
+    except TypeError:  # pragma: no cover
+        # unhashable
+        return _compile_type_checker(tp)
+
+
+def _compile_type_checker(tp: Any) -> Callable[[Any], Optional[bool]]:
+    if tp is Any:
+        return lambda arg: True
+
+    if _plain_class(tp):
+        classes = _with_promotions((tp,))
+    elif get_origin(tp) in _UNION_TYPES and all(
+        map(_plain_class, get_args(tp))
+    ):
+        classes = _with_promotions(get_args(tp))
+    elif (typeguard := _typeguard()) is not None:
+
+        def check_typeguard(arg) -> bool:
+            try:
+                typeguard.check_type("value", arg, tp)
+            except TypeError:
+                return False
+            return True
+
+        return check_typeguard
+    else:
+        return functools.partial(_isinstance_typing, tp=tp)
+
+    if len(classes) == 1:
+        (cls,) = classes
+        return lambda arg: isinstance(arg, cls)
+    return lambda arg: isinstance(arg, classes)
+
+
+@functools.lru_cache(maxsize=None)
+def _typeguard() -> Optional[types.ModuleType]:
+    """
+    Imports typeguard if installed, once it's first needed; i.e. for param
+    types that cannot be checked with `isinstance`.
+    """
+    try:
+        import typeguard
+    except ImportError:
+        return None
+    return typeguard
+
+
+def _plain_class(tp: Any) -> bool:
+    """Whether `isinstance` can be used for checking the type."""
+    if not isinstance(tp, type):
+        return False
+    try:
+        isinstance(None, tp)
+    except TypeError:
+        # e.g. parametrized generics and non-runtime protocols
+        return False
+    return True
+
+
+def _with_promotions(classes: Tuple[type, ...]) -> Tuple[type, ...]:
+    res = list(classes)
+    for cls in classes:
+        res.extend(c for c in _NUMERIC_TOWER.get(cls, ()) if c not in res)
+    return tuple(res)
+
+
 def _specialattr(name: str) -> bool:
     return name[:2] == name[-2:] == "__"
 
@@ -539,6 +1870,11 @@ def _privateattr(cls: type, name: str) -> bool:
     return name.startswith(f"_{cls.__name__}__")
 
 
+def _descriptor(value: Any) -> bool:
+    # i.e. methods and properties
+    return hasattr(type(value), "__get__")
+
+
 def _isinstance_typing(  # noqa: C901
     arg: Union[T, Any], tp: Optional[Type[T]]
 ) -> Optional[bool]:
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 __all__ = [
     "is_decoratable",
+    "is_coroutinefunction",
+    "is_generatorfunction",
+    "is_asyncgenfunction",
     "get_function_type",
     "FunctionType",
     "ClassMethod",
@@ -9,11 +12,14 @@ __all__ = [
 ]
 
 import enum
-import inspect
+import sys
+import types
 from typing import (
     Any,
     Callable,
+    Final,
     Literal,
+    Optional,
     Protocol,
     TypeVar,
     Union,
@@ -119,6 +125,80 @@ def is_decoratable(fn: Union[Callable, classmethod, staticmethod, Any]) -> bool:
     return callable(fn) or isinstance(fn, (classmethod, staticmethod))
 
 
+def is_coroutinefunction(
+    fn: Union[Callable, ClassMethodDescriptor, classmethod, staticmethod]
+) -> bool:
+    """
+    Like `inspect.iscoroutinefunction`, but also works on (unbound) class-
+    and staticmethods.
+    """
+    return _has_code_flag(fn, _CO_COROUTINE, "iscoroutinefunction")
+
+
+def is_generatorfunction(
+    fn: Union[Callable, ClassMethodDescriptor, classmethod, staticmethod]
+) -> bool:
+    """
+    Like `inspect.isgeneratorfunction`, but also works on (unbound) class-
+    and staticmethods.
+    """
+    return _has_code_flag(fn, _CO_GENERATOR, "isgeneratorfunction")
+
+
+def is_asyncgenfunction(
+    fn: Union[Callable, ClassMethodDescriptor, classmethod, staticmethod]
+) -> bool:
+    """
+    Like `inspect.isasyncgenfunction`, but also works on (unbound) class-
+    and staticmethods.
+    """
+    return _has_code_flag(fn, _CO_ASYNC_GENERATOR, "isasyncgenfunction")
+
+
+# code object flags, as in `inspect`
+_CO_VARARGS: Final = 0x4
+_CO_VARKEYWORDS: Final = 0x8
+_CO_GENERATOR: Final = 0x20
+_CO_COROUTINE: Final = 0x80
+_CO_ASYNC_GENERATOR: Final = 0x200
+
+
+def _has_code_flag(
+    fn: Union[Callable, ClassMethodDescriptor, classmethod, staticmethod],
+    flag: int,
+    inspect_function: str,
+) -> bool:
+    """
+    Checks the code flag of the innermost function, unwrapping methods, class-
+    and staticmethods, decorators and other wrappers by `__func__` or
+    `__wrapped__`. This doesn't depend on how `inspect` treats function-like
+    objects, which differs between Python versions.
+
+    Anything else, e.g. `functools.partial`, is passed to the `inspect`
+    function. It's only imported if needed, because it takes longer to import
+    than this package.
+    """
+    # like `inspect.unwrap`, which stops at cycles by the same limit
+    for _ in range(sys.getrecursionlimit()):
+        if type(fn) is types.FunctionType:
+            # `inspect.markcoroutinefunction` sets the marker since 3.12
+            if hasattr(fn, "_is_coroutine_marker"):
+                break
+            return bool(fn.__code__.co_flags & flag)
+
+        # not the `__wrapped__` of functions, which may differ in kind
+        inner = getattr(fn, "__func__", None)
+        if inner is None:
+            inner = getattr(fn, "__wrapped__", None)
+        if inner is None:
+            break
+        fn = inner
+
+    import inspect
+
+    return getattr(inspect, inspect_function)(fn)
+
+
 def get_function_type(
     fn: Union[Callable, ClassMethodDescriptor]
 ) -> FunctionType:
@@ -136,8 +216,48 @@ def get_function_type(
     elif instance is not None:
         return FunctionType.INSTANCEMETHOD_BOUND
 
-    params = list(inspect.signature(fn).parameters)
-    if params and params[0] == "self":
+    if _first_param_name(fn) == "self":
         return FunctionType.INSTANCEMETHOD_UNBOUND
     else:
         return FunctionType.FUNCTION
+
+
+def _first_param_name(fn: Callable) -> Optional[str]:
+    """
+    The name of the first parameter in the signature of a callable.
+
+    For (wrapped) functions this is read from the code object, which is
+    equivalent to `inspect.signature`. Other callables fall back to that, and
+    are considered to have no parameters if they have no signature.
+    """
+    unwrapped = fn
+    # like `inspect.unwrap`, which stops at cycles by the same limit
+    for _ in range(sys.getrecursionlimit()):
+        if hasattr(unwrapped, "__signature__"):
+            break
+        if (wrapped := getattr(unwrapped, "__wrapped__", None)) is not None:
+            unwrapped = wrapped
+        elif type(unwrapped) is types.FunctionType:
+            return _first_varname(unwrapped.__code__)
+        else:
+            break
+
+    import inspect
+
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        # e.g. some builtins
+        return None
+    return next(iter(params), None)
+
+
+def _first_varname(code: types.CodeType) -> Optional[str]:
+    # the order of co_varnames is positional, keyword-only, *args, **kwargs
+    if code.co_argcount:
+        return code.co_varnames[0]
+    elif code.co_flags & _CO_VARARGS:
+        return code.co_varnames[code.co_kwonlyargcount]
+    elif code.co_kwonlyargcount or code.co_flags & _CO_VARKEYWORDS:
+        return code.co_varnames[0]
+    return None
@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+__all__ = [
+    "BUCKETS",
+    "PROFILERS",
+    "CallStats",
+    "get_stats",
+    "configure",
+    "check_sampling",
+    "snapshot",
+    "report",
+    "reset",
+]
+
+import bisect
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Final, List, Optional, Tuple
+
+# upper bounds of the latency histogram buckets in seconds; the last bucket
+# has no upper bound
+BUCKETS: Final = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+_BUCKETS_NS: Final = tuple(int(b * 1e9) for b in BUCKETS)
+# the profilers that sampled calls can be run with
+PROFILERS: Final = frozenset({"cprofile", "tracemalloc"})
+
+
+class CallStats:
+    """
+    Call statistics of a decorated function, see `Decorator`.
+
+    Only 1 in `sample` calls is recorded; the others only decrement the
+    `countdown`. So `calls` and `errors` are those of the sampled calls, and
+    `total_calls` also counts the others. Sampled calls of non-async
+    functions can also be profiled with cProfile or tracemalloc, if `profile`
+    is set. Their durations then include the overhead of the profiler.
+
+    The counters are updated without locking, to keep the overhead of the
+    calls low. So concurrent calls in other threads may be lost from the
+    counts, and the `countdown` may sample a call more or less often.
+    """
+
+    __slots__ = (
+        "decorator",
+        "function",
+        "function_type",
+        "calls",
+        "errors",
+        "skipped",
+        "histogram",
+        "sample",
+        "countdown",
+        "profile",
+        "profiler",
+        "memory",
+        "peak_memory",
+        "lock",
+    )
+
+    def __init__(
+        self,
+        decorator: str,
+        function: str,
+        sample: int = 1,
+        profile: Optional[str] = None,
+    ):
+        self.decorator = decorator
+        self.function = function
+        # "function", "method", "classmethod" or "staticmethod"
+        self.function_type = "function"
+        # of the sampled calls
+        self.calls = self.errors = 0
+        # the calls that weren't sampled, apart from those since the last
+        # sampled call, see `total_calls`
+        self.skipped = 0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+        self.sample = self.countdown = sample
+        self.profile = profile
+        # the `cProfile.Profile` of the sampled calls, once profiled
+        self.profiler: Any = None
+        # the bytes allocated (and not freed) by the sampled calls in total,
+        # and the peak of a single call, if profiled with tracemalloc
+        self.memory = self.peak_memory = 0
+        # held while profiling with cProfile, so that only one call is
+        # profiled at a time; tracemalloc uses `_tracemalloc_lock`
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}("
+            f"decorator={self.decorator!r}, "
+            f"function={self.function!r}, "
+            f"total_calls={self.total_calls}, "
+            f"calls={self.calls}, "
+            f"errors={self.errors}"
+            f")"
+        )
+
+    @property
+    def total_calls(self) -> int:
+        """The number of calls, including those that weren't sampled."""
+        return self.calls + self.skipped + self.sample - self.countdown
+
+    def record(self, elapsed_ns: int, error: bool = False):
+        """Records a sampled call, which ends a `sample` of calls."""
+        self.calls += 1
+        self.skipped += self.sample - 1
+        if error:
+            self.errors += 1
+        self.histogram[bisect.bisect_left(_BUCKETS_NS, elapsed_ns)] += 1
+
+    def record_profiled(
+        self, call: Callable, args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Any:
+        """
+        Calls and records a sampled call with the `profile` profiler; unless
+        another call is being profiled, or another profiler is active.
+        Tracing memory is process-wide, so only one call of any function is
+        profiled with tracemalloc at a time.
+        """
+        traced = self.profile == "tracemalloc"
+        lock = _tracemalloc_lock if traced else self.lock
+        if not lock.acquire(blocking=False):
+            return self.__record(call, args, kwargs)
+        try:
+            if traced:
+                return self.__record_tracemalloc(call, args, kwargs)
+            return self.__record_cprofile(call, args, kwargs)
+        finally:
+            lock.release()
+
+    def quantile(self, q: float) -> float:
+        """
+        The upper bound in seconds of the histogram bucket that contains the
+        `q` quantile, or `math.inf` for the last bucket; `nan` if empty.
+        """
+        if not self.calls:
+            return math.nan
+
+        count = 0
+        for bucket, n in zip(BUCKETS, self.histogram):
+            count += n
+            if count >= q * self.calls:
+                return bucket
+        return math.inf
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "decorator": self.decorator,
+            "function": self.function,
+            "type": self.function_type,
+            "calls": self.total_calls,
+            "sampled_calls": self.calls,
+            "sampled_errors": self.errors,
+            "histogram": list(self.histogram),
+            "sample": self.sample,
+            "memory": self.memory,
+            "peak_memory": self.peak_memory,
+        }
+
+    def reset(self):
+        self.calls = self.errors = self.skipped = 0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+        self.countdown = self.sample
+        self.profiler = None
+        self.memory = self.peak_memory = 0
+
+    def __record(self, call, args, kwargs) -> Any:
+        start = time.perf_counter_ns()
+        try:
+            res = call(*args, **kwargs)
+        except BaseException:
+            self.record(time.perf_counter_ns() - start, True)
+            raise
+        self.record(time.perf_counter_ns() - start)
+        return res
+
+    def __record_cprofile(self, call, args, kwargs) -> Any:
+        if (profiler := self.profiler) is None:
+            # only imported once needed
+            import cProfile
+
+            profiler = self.profiler = cProfile.Profile()
+
+        # the profiler is only enabled during the call, so that the profile
+        # doesn't include the recording
+        start = time.perf_counter_ns()
+        try:
+            profiler.enable()
+        except ValueError:
+            # another profiler is active in this thread
+            return self.__record(call, args, kwargs)
+        try:
+            res = call(*args, **kwargs)
+        except BaseException:
+            profiler.disable()
+            self.record(time.perf_counter_ns() - start, True)
+            raise
+        profiler.disable()
+        self.record(time.perf_counter_ns() - start)
+        return res
+
+    def __record_tracemalloc(self, call, args, kwargs) -> Any:
+        import tracemalloc
+
+        # if tracing is started for the call, the peak is that of the call;
+        # otherwise it's reset, or only the retained memory is known before
+        # Python 3.9
+        started = not tracemalloc.is_tracing()
+        reset_peak = getattr(tracemalloc, "reset_peak", None)
+        if started:
+            tracemalloc.start()
+        elif reset_peak is not None:
+            reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        try:
+            return self.__record(call, args, kwargs)
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            if started:
+                tracemalloc.stop()
+            elif reset_peak is None:
+                peak = after
+            self.memory += after - before
+            self.peak_memory = max(self.peak_memory, peak - before)
+
+
+# (decorator qualname, function module and qualname) => stats
+_registry: Dict[Tuple[str, str], CallStats] = {}
+# held while a call is profiled with tracemalloc
+_tracemalloc_lock = threading.Lock()
+
+
+def get_stats(
+    decorator: type, function: Any, function_type: Any = None
+) -> CallStats:
+    """
+    Returns the (shared) stats of a function decorated by a decorator class.
+    Functions are identified by their module and qualified name. If set, the
+    `FunctionType` of the decorated function is stored as well.
+    The `sample` and `profile` are those of the decorator class at first.
+    """
+    key = (
+        f"{decorator.__module__}.{decorator.__qualname__}",
+        f"{function.__module__}.{function.__qualname__}",
+    )
+    if (stats := _registry.get(key)) is None:
+        stats = _registry.setdefault(
+            key,
+            CallStats(
+                *key,
+                sample=getattr(decorator, "__decorator_sample__", 1),
+                profile=getattr(decorator, "__decorator_profile__", None),
+            ),
+        )
+    if function_type is not None:
+        # e.g. "bound classmethod" => "classmethod"
+        stats.function_type = str(function_type).split()[-1]
+    return stats
+
+
+def configure(
+    decorated: Any, sample: int = 1, profile: Optional[str] = None
+) -> CallStats:
+    """
+    Sets the `sample` interval and `profile` of a decorated function, method
+    or binding; its stats are returned.
+    """
+    if not getattr(type(decorated), "__decorator_instrumented__", False):
+        raise TypeError(f"{decorated!r} is not instrumented")
+    check_sampling(sample, profile)
+
+    stats = get_stats(type(decorated), decorated.__func__)
+    # the calls since the last sampled call are counted as skipped
+    stats.skipped += stats.sample - stats.countdown
+    stats.sample = stats.countdown = sample
+    stats.profile = profile
+    return stats
+
+
+def check_sampling(sample: int, profile: Optional[str]):
+    """Raises `ValueError` if the sampling settings are invalid."""
+    if sample < 1:
+        raise ValueError("sample must be at least 1")
+    if profile is not None and profile not in PROFILERS:
+        raise ValueError(
+            f"profile must be one of {sorted(PROFILERS)}, got {profile!r}"
+        )
+
+
+def snapshot() -> List[Dict[str, Any]]:
+    """
+    Returns the stats of all instrumented decorated functions. Each histogram
+    has a count for each of the `BUCKETS`, followed by the overflow count.
+    """
+    return [stats.snapshot() for stats in list(_registry.values())]
+
+
+def report(limit: int = 10) -> str:
+    """
+    Returns a report of the stats of all instrumented decorated functions,
+    with the (estimated) latency quantiles, and for the functions profiled
+    with cProfile, the `limit` functions with the highest cumulative time.
+    """
+    header = (
+        "function",
+        "type",
+        "decorator",
+        "sample",
+        "calls",
+        "sampled_calls",
+        "sampled_errors",
+        "p50",
+        "p90",
+        "p99",
+        "memory",
+    )
+    rows: List[Tuple[str, ...]] = [header]
+    profiled = []
+    for stats in list(_registry.values()):
+        rows.append(
+            (
+                stats.function,
+                stats.function_type,
+                stats.decorator,
+                f"1/{stats.sample}",
+                str(stats.total_calls),
+                str(stats.calls),
+                str(stats.errors),
+                *(_format_seconds(stats.quantile(q)) for q in (0.5, 0.9, 0.99)),
+                str(stats.memory) if stats.profile == "tracemalloc" else "",
+            )
+        )
+        if stats.profiler is not None:
+            profiled.append(stats)
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    lines = [
+        "  ".join(value.ljust(width) for value, width in zip(row, widths))
+        .rstrip()
+        for row in rows
+    ]
+
+    for stats in profiled:
+        # only imported once needed
+        import io
+        import pstats
+
+        stream = io.StringIO()
+        with stats.lock:
+            # not while it's profiling a call
+            profile = pstats.Stats(stats.profiler, stream=stream)
+        profile.sort_stats("cumulative").print_stats(limit)
+        title = f"{stats.function} ({stats.decorator})"
+        lines += ["", title, stream.getvalue()]
+
+    return "\n".join(lines)
+
+
+def _format_seconds(seconds: float) -> str:
+    if math.isnan(seconds):
+        return "-"
+    if math.isinf(seconds):
+        return f">{BUCKETS[-1]:g}s"
+    return f"<={seconds:g}s"
+
+
+def reset():
+    """Resets the stats of all instrumented decorated functions."""
+    for stats in list(_registry.values()):
+        stats.reset()
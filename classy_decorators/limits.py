@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+__all__ = ["ConcurrencyLimit", "RateLimit"]
+
+import abc
+import collections
+import threading
+import time
+import weakref
+from typing import TYPE_CHECKING, Any, Deque, Dict, Tuple, Union
+
+from classy_decorators.decorators import Decorator, _get_scoped
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+_LockType = type(threading.Lock())
+
+
+class _Semaphore:
+    """
+    Counting semaphore for threads and asyncio tasks.
+
+    While no one is waiting, a permit is taken from (and returned to) a deque
+    without locking. Otherwise, callers wait in FIFO order, and released
+    permits are handed to the first waiter; see `__wake`.
+    """
+
+    __slots__ = ("permits", "waiters", "lock")
+
+    def __init__(self, value: int):
+        self.permits: Deque[None] = collections.deque([None] * value)
+        # locks of waiting threads, or futures of waiting tasks
+        self.waiters: Deque[Union[threading.Lock, asyncio.Future]]
+        self.waiters = collections.deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if self.__try_acquire():
+            return
+
+        waiter = threading.Lock()
+        waiter.acquire()
+        self.__wait(waiter)
+        waiter.acquire()
+
+    async def acquire_async(self):
+        if self.__try_acquire():
+            return
+
+        # asyncio is imported once a coroutine runs
+        import asyncio
+
+        future = asyncio.get_running_loop().create_future()
+        self.__wait(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self.lock:
+                try:
+                    self.waiters.remove(future)
+                except ValueError:
+                    # already granted
+                    granted = future.done() and not future.cancelled()
+                else:
+                    granted = False
+            if granted:
+                # outside the (non-reentrant) lock, which `release` takes
+                self.release()
+            raise
+
+    def release(self):
+        self.permits.append(None)
+        if self.waiters:
+            with self.lock:
+                self.__wake()
+
+    def __try_acquire(self) -> bool:
+        if not self.waiters:
+            try:
+                self.permits.pop()
+            except IndexError:
+                pass
+            else:
+                return True
+        return False
+
+    def __wait(self, waiter: Union[threading.Lock, asyncio.Future]):
+        with self.lock:
+            self.waiters.append(waiter)
+            # a permit may have been released before the waiter was added
+            self.__wake()
+
+    def __wake(self):
+        """Hands the available permits to the waiters; `lock` must be held."""
+        while self.waiters:
+            try:
+                self.permits.pop()
+            except IndexError:
+                return
+
+            waiter = self.waiters.popleft()
+            if type(waiter) is _LockType:
+                waiter.release()
+            else:
+                waiter.get_loop().call_soon_threadsafe(self.__grant, waiter)
+
+    def __grant(self, future: asyncio.Future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+
+class _Bucket:
+    """
+    Token bucket, as the equivalent generic cell rate algorithm (GCRA): each
+    call reserves the next slot, and waits until it's due. So the waiting
+    callers are served in FIFO order, and nothing has to be refilled.
+    """
+
+    __slots__ = ("interval", "tolerance", "tat", "lock")
+
+    def __init__(self, rate: float, burst: int):
+        self.interval = 1 / rate
+        self.tolerance = (burst - 1) * self.interval
+        # theoretical arrival time of the next call
+        self.tat = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if (delay := self.__reserve()) > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        if (delay := self.__reserve()) > 0:
+            import asyncio
+
+            await asyncio.sleep(delay)
+
+    def release(self):
+        pass
+
+    def __reserve(self) -> float:
+        """Returns the seconds until the reserved slot is due."""
+        with self.lock:
+            now = time.monotonic()
+            tat = max(self.tat, now)
+            self.tat = tat + self.interval
+        return tat - self.tolerance - now
+
+
+class _Limit(Decorator, metaclass=abc.ABCMeta):
+    """
+    Base class of the limiting decorators. Instance methods have a limit per
+    instance, classmethods per class, and functions and staticmethods a
+    single limit.
+    """
+
+    def __decorate__(self, **kwargs):
+        if self.is_generatorfunction or self.is_asyncgenfunction:
+            raise TypeError(f"cannot limit generator function {self}")
+
+        if self.is_instancemethod or self.is_classmethod:
+            # id of the instance or class => (weakref, limit)
+            self._limits: Dict[int, Tuple[weakref.ref, Any]] = {}
+        else:
+            self._limit = self._new_limit()
+
+    def __bind__(self, instance_or_class):
+        if self.is_instancemethod or self.is_classmethod:
+            self._limit = _get_scoped(
+                self, instance_or_class, self._limits, self._new_limit, "limit"
+            )
+
+    def __call_inner__(self, *args, **kwargs) -> Any:
+        limit = self._limit
+        limit.acquire()
+        try:
+            return super().__call_inner__(*args, **kwargs)
+        finally:
+            limit.release()
+
+    async def __call_inner_async__(self, *args, **kwargs) -> Any:
+        limit = self._limit
+        await limit.acquire_async()
+        try:
+            return await super().__call_inner_async__(*args, **kwargs)
+        finally:
+            limit.release()
+
+    @abc.abstractmethod
+    def _new_limit(self) -> Union[_Semaphore, _Bucket]:
+        """Returns a new limit, for a function, instance or class."""
+
+
+class ConcurrencyLimit(_Limit):
+    """
+    Limits the number of concurrent calls of the decorated function or
+    method, in threads or asyncio tasks, to `max_concurrency`. Other calls
+    wait for their turn in FIFO order; in async functions without blocking
+    the event loop.
+    """
+
+    max_concurrency: int
+
+    def __decorate__(self, **kwargs):
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        super().__decorate__(**kwargs)
+
+    def _new_limit(self) -> _Semaphore:
+        return _Semaphore(self.max_concurrency)
+
+
+class RateLimit(_Limit):
+    """
+    Limits the calls of the decorated function or method to `rate` per
+    second on average, with bursts of at most `burst` calls, like a token
+    bucket. Calls that exceed it wait for their turn in FIFO order; in async
+    functions without blocking the event loop.
+    """
+
+    # calls per second
+    rate: float
+    burst: int = 1
+
+    def __decorate__(self, **kwargs):
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        super().__decorate__(**kwargs)
+
+    def _new_limit(self) -> _Bucket:
+        return _Bucket(self.rate, self.burst)
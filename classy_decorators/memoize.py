@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+__all__ = ["Memoize", "CacheInfo"]
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from classy_decorators.decorators import Decorator, _get_scoped
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+_MISS = object()
+_KWD_MARK = object()
+
+
+class _Cache:
+    """
+    LRU cache with optional time-to-live, for a single function. Updating
+    the order of the entries isn't atomic, so it's done holding `lock`.
+    """
+
+    __slots__ = ("maxsize", "ttl", "data", "hits", "misses", "lock")
+
+    def __init__(self, maxsize: Optional[int], ttl: Optional[float]):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # key => (value, expiry time or None), least recently used first
+        self.data: OrderedDict[Hashable, Tuple[Any, Optional[float]]]
+        self.data = OrderedDict()
+        self.hits = self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self.lock:
+            try:
+                value, expires = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return _MISS
+
+            if expires is not None and expires <= time.monotonic():
+                del self.data[key]
+                self.misses += 1
+                return _MISS
+
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        if self.maxsize == 0:
+            return
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            self.data[key] = value, expires
+            self.data.move_to_end(key)
+            if self.maxsize is not None and len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = self.misses = 0
+
+
+class Memoize(Decorator):
+    """
+    Caches the results of the decorated function or method, like
+    `functools.lru_cache`.
+
+    Instance methods have a cache per instance, and classmethods per class.
+    These caches are removed once their instance or class is garbage
+    collected. `cache_info()` and `cache_clear()` apply to the cache of a
+    bound method, or to all caches of an unbound method.
+    """
+
+    maxsize: Optional[int] = 128
+    # seconds after which a cached result expires, if set
+    ttl: Optional[float] = None
+    typed: bool = False
+
+    def __decorate__(self, **kwargs):
+        if self.is_generatorfunction or self.is_asyncgenfunction:
+            raise TypeError(f"cannot memoize generator function {self}")
+
+        if self.is_instancemethod or self.is_classmethod:
+            # id of the instance or class => (weakref, cache)
+            self._caches: Dict[int, Tuple[weakref.ref, _Cache]] = {}
+        else:
+            self._cache = _Cache(self.maxsize, self.ttl)
+
+    def __bind__(self, instance_or_class):
+        if self.is_instancemethod or self.is_classmethod:
+            self._cache = _get_scoped(
+                self,
+                instance_or_class,
+                self._caches,
+                lambda: _Cache(self.maxsize, self.ttl),
+                "memoize",
+            )
+
+    def __call_inner__(self, *args, **kwargs):
+        cache = self._cache
+        key = _make_key(args, kwargs, self.typed)
+        if (res := cache.get(key)) is _MISS:
+            res = super().__call_inner__(*args, **kwargs)
+            cache.set(key, res)
+        return res
+
+    async def __call_inner_async__(self, *args, **kwargs):
+        cache = self._cache
+        key = _make_key(args, kwargs, self.typed)
+        if (res := cache.get(key)) is _MISS:
+            res = await super().__call_inner_async__(*args, **kwargs)
+            cache.set(key, res)
+        return res
+
+    def cache_info(self) -> CacheInfo:
+        caches = self.__caches()
+        return CacheInfo(
+            hits=sum(cache.hits for cache in caches),
+            misses=sum(cache.misses for cache in caches),
+            maxsize=self.maxsize,
+            currsize=sum(len(cache.data) for cache in caches),
+        )
+
+    def cache_clear(self):
+        for cache in self.__caches():
+            cache.clear()
+
+    def __caches(self) -> List[_Cache]:
+        if (cache := getattr(self, "_cache", None)) is not None:
+            return [cache]
+        return [cache for _, cache in list(self._caches.values())]
+
+
+def _make_key(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any], typed: bool
+) -> Hashable:
+    # based on functools._make_key
+    key = args
+    if kwargs:
+        key += (_KWD_MARK, *kwargs.items())
+    if typed:
+        key += tuple(type(v) for v in args)
+        if kwargs:
+            key += tuple(type(v) for v in kwargs.values())
+    elif len(key) == 1 and type(key[0]) in {int, str}:
+        return key[0]
+    return key
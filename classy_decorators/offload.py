@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+__all__ = ["Offload"]
+
+import atexit
+import os
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Final, Optional, Tuple, Union
+
+from classy_decorators.decorators import Decorator
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+    from concurrent.futures import Executor, Future
+
+_EXECUTOR_KINDS: Final = frozenset({"thread", "process"})
+
+
+class Offload(Decorator):
+    """
+    Submits calls of the decorated function or method to a thread or process
+    pool, and returns a `concurrent.futures.Future` of the result. When called
+    from a running asyncio event loop, an awaitable `asyncio.Future` is
+    returned instead.
+
+    The pools are shared by all decorators with the same `executor` and
+    `max_workers`, and are shut down at exit, or by `Offload.shutdown()`.
+    For process pools, the decorated function and its arguments are pickled;
+    for bound methods this includes the instance.
+
+    Overrides of `__call_inner__` in subclasses run in the calling thread,
+    around the submission. The `__call_inner__` of the classes that follow
+    `Offload` in the MRO, e.g. of other decorator mixins, run in the pool.
+    """
+
+    # "thread" or "process"
+    executor: str = "thread"
+    max_workers: Optional[int] = None
+
+    def __decorate__(self, **kwargs):
+        if self.executor not in _EXECUTOR_KINDS:
+            raise ValueError(
+                f"executor must be one of {sorted(_EXECUTOR_KINDS)}, "
+                f"got {self.executor!r}"
+            )
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if (
+            self.is_coroutinefunction
+            or self.is_generatorfunction
+            or self.is_asyncgenfunction
+        ):
+            raise TypeError(f"cannot offload {self}")
+
+    def __call_inner__(
+        self, *args, **kwargs
+    ) -> Union[Future, asyncio.Future]:
+        pool = _get_pool(self.executor, self.max_workers)
+        future = pool.submit(_call_inner, self, *args, **kwargs)
+
+        # no event loop can be running if asyncio isn't imported
+        if "asyncio" in sys.modules:
+            import asyncio
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+            else:
+                return asyncio.wrap_future(future, loop=loop)
+
+        return future
+
+    @classmethod
+    def shutdown(cls, wait: bool = True):
+        """
+        Shuts down the shared pools; new ones are created when needed.
+        """
+        with _lock:
+            pools = list(_pools.values())
+            _pools.clear()
+
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+
+def _call_inner(decorator: Offload, /, *args, **kwargs) -> Any:
+    """
+    Runs the call in the pool: the next `__call_inner__` after `Offload` in
+    the MRO of the decorator, since the overrides before it already ran.
+    """
+    return super(Offload, decorator).__call_inner__(*args, **kwargs)
+
+
+# (executor kind, max workers) => pool
+_pools: Dict[Tuple[str, Optional[int]], Executor] = {}
+_lock = threading.Lock()
+
+
+def _get_pool(kind: str, max_workers: Optional[int]) -> Executor:
+    key = kind, max_workers
+    if (pool := _pools.get(key)) is not None:
+        return pool
+
+    with _lock:
+        if (pool := _pools.get(key)) is None:
+            # concurrent.futures is only imported once it's needed
+            from concurrent import futures
+
+            if kind == "process":
+                pool = futures.ProcessPoolExecutor(max_workers)
+            else:
+                pool = futures.ThreadPoolExecutor(
+                    max_workers, thread_name_prefix="Offload"
+                )
+            _pools[key] = pool
+            _register_hooks()
+
+    return pool
+
+
+_hooks_registered = False
+
+
+def _register_hooks():
+    """Registers the shutdown at exit and the fork handler, once."""
+    global _hooks_registered
+    if _hooks_registered:
+        return
+    _hooks_registered = True
+
+    atexit.register(Offload.shutdown)
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_after_fork)
+
+
+def _after_fork():
+    # the pools of the parent process can't be used in a forked child
+    global _lock
+    _pools.clear()
+    _lock = threading.Lock()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+__all__ = ["Singleflight", "FlightInfo"]
+
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Union,
+)
+
+from classy_decorators.decorators import Decorator
+from classy_decorators.memoize import _make_key
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+
+
+class FlightInfo(NamedTuple):
+    calls: int
+    # calls that shared the result of an identical call in flight
+    deduplicated: int
+    in_flight: int
+
+
+class _Target:
+    """
+    Key of the instance or class that a call is bound to, by identity. It
+    references the target, so that while the call is in flight, the target
+    isn't garbage collected and its id isn't reused; also if the binding
+    references it weakly.
+    """
+
+    __slots__ = ("target",)
+
+    def __init__(self, target: Any):
+        self.target = target
+
+    def __eq__(self, other) -> bool:
+        return type(other) is _Target and other.target is self.target
+
+    def __hash__(self) -> int:
+        return id(self.target)
+
+
+class _Call:
+    """A call in flight, of which the other threads wait for the result."""
+
+    __slots__ = ("done", "thread", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.thread = threading.get_ident()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+class _Flights:
+    """The calls in flight of a decorated function, and their counters."""
+
+    __slots__ = ("lock", "calls", "deduplicated", "pending")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = self.deduplicated = 0
+        # key => call, or task for async functions
+        self.pending: Dict[Hashable, Union[_Call, asyncio.Task]] = {}
+
+    def discard(self, key: Hashable, call: Any):
+        with self.lock:
+            if self.pending.get(key) is call:
+                del self.pending[key]
+
+
+class Singleflight(Decorator):
+    """
+    Deduplicates concurrent calls of the decorated function or method with
+    identical arguments: while a call is in flight, identical calls wait for
+    it and share its result or exception, instead of calling it again.
+
+    Calls of methods are only identical if they're bound to the same
+    instance or class. Both threads and asyncio tasks are supported; for
+    async functions the call runs as task, so cancelling one of the callers
+    doesn't cancel the others. The arguments must be hashable.
+    """
+
+    typed: bool = False
+
+    def __decorate__(self, **kwargs):
+        if self.is_generatorfunction or self.is_asyncgenfunction:
+            raise TypeError(f"cannot deduplicate generator function {self}")
+
+        self._flights = _Flights()
+
+    def __call_inner__(self, *args, **kwargs) -> Any:
+        flights = self._flights
+        key = self.__key(args, kwargs)
+        leader = False
+        with flights.lock:
+            flights.calls += 1
+            call = flights.pending.get(key)
+            if call is None:
+                call = flights.pending[key] = _Call()
+                leader = True
+            elif call.thread == threading.get_ident():
+                # a recursive call, which can't wait for itself
+                call = None
+            else:
+                flights.deduplicated += 1
+
+        if call is None:
+            return super().__call_inner__(*args, **kwargs)
+        if not leader:
+            return call.wait()
+
+        try:
+            call.result = super().__call_inner__(*args, **kwargs)
+        except BaseException as exc:
+            call.exception = exc
+            raise
+        finally:
+            flights.discard(key, call)
+            call.done.set()
+        return call.result
+
+    async def __call_inner_async__(self, *args, **kwargs) -> Any:
+        # asyncio is imported once a coroutine runs
+        import asyncio
+
+        flights = self._flights
+        loop = asyncio.get_running_loop()
+        key = loop, self.__key(args, kwargs)
+        with flights.lock:
+            flights.calls += 1
+            task = flights.pending.get(key)
+            if task is None:
+                task = loop.create_task(
+                    super().__call_inner_async__(*args, **kwargs)
+                )
+                task.add_done_callback(
+                    lambda task: flights.discard(key, task)
+                )
+                flights.pending[key] = task
+            else:
+                flights.deduplicated += 1
+
+        return await asyncio.shield(task)
+
+    def flight_info(self) -> FlightInfo:
+        flights = self._flights
+        with flights.lock:
+            return FlightInfo(
+                calls=flights.calls,
+                deduplicated=flights.deduplicated,
+                in_flight=len(flights.pending),
+            )
+
+    def __key(self, args, kwargs) -> Hashable:
+        target = _Target(getattr(self, "__self__", None))
+        return target, _make_key(args, kwargs, self.typed)
@@ -0,0 +1,23 @@
+import asyncio
+
+from examples.multiply import Multiply
+
+
+class AsyncMultiply(Multiply):
+    async def __call_inner_async__(self, *args, **kwargs) -> float:
+        res = await super().__call_inner_async__(*args, **kwargs)
+        return res * self.factor
+
+
+@AsyncMultiply(2)
+async def add_and_double(a, b):
+    return a + b
+
+
+@AsyncMultiply(2)
+def add_and_double_sync(a, b):
+    return a + b
+
+
+assert asyncio.run(add_and_double(8, 15)) == 46
+assert add_and_double_sync(8, 15) == 46
@@ -0,0 +1,32 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def test_suite():
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    output = subprocess.run(
+        [
+            sys.executable,
+            str(ROOT / "benchmarks" / "suite.py"),
+            "--json",
+            "--number=1",
+            "--repeat=1",
+        ],
+        env=env,
+        check=True,
+        capture_output=True,
+    ).stdout
+
+    report = json.loads(output)
+    assert report["version"] == (ROOT / "VERSION").read_text().strip()
+
+    names = [res["name"] for res in report["results"]]
+    assert len(names) == len(set(names))
+    for res in report["results"]:
+        assert res["classy_ns"] > 0
+        assert res["baseline_ns"] > 0
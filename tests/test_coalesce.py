@@ -0,0 +1,198 @@
+import asyncio
+
+import pytest
+
+from classy_decorators import Coalesce, Decorator
+
+
+class Spam:
+    def __init__(self, factor=2):
+        self.factor = factor
+        self.batches = []
+
+    @Coalesce
+    async def get(self, keys):
+        self.batches.append(keys)
+        return [key * self.factor for key in keys]
+
+    @Coalesce(max_batch_size=3)
+    async def get_small(self, keys):
+        self.batches.append(keys)
+        return keys
+
+    @Coalesce(max_delay=0.01)
+    async def get_delayed(self, keys):
+        self.batches.append(keys)
+        return keys
+
+    @Coalesce  # noqa
+    @classmethod
+    async def get_cls(cls, keys):
+        return [(cls, key) for key in keys]
+
+    @Coalesce
+    async def get_invalid(self, keys):
+        return keys[1:]
+
+    @Coalesce
+    async def get_error(self, keys):
+        raise ValueError(keys)
+
+
+def test_function():
+    batches = []
+
+    @Coalesce
+    async def eggs(keys):
+        batches.append(keys)
+        return [-key for key in keys]
+
+    async def main():
+        return await asyncio.gather(*(eggs(key) for key in range(5)))
+
+    assert asyncio.run(main()) == [0, -1, -2, -3, -4]
+    assert batches == [[0, 1, 2, 3, 4]]
+
+
+def test_subclass():
+    calls = []
+
+    class Reverse(Decorator):
+        async def __call_inner_async__(self, keys):
+            res = await super().__call_inner_async__(keys)
+            return res[::-1]
+
+    class CoalesceLogged(Coalesce, Reverse):
+        async def __call_inner_async__(self, key):
+            calls.append(key)
+            return await super().__call_inner_async__(key)
+
+    @CoalesceLogged
+    async def eggs(keys):
+        return keys[::-1]
+
+    async def main():
+        return await asyncio.gather(*(eggs(key) for key in range(3)))
+
+    # the override for each caller, the mixin after Coalesce for the batch
+    assert asyncio.run(main()) == [0, 1, 2]
+    assert calls == [0, 1, 2]
+
+
+def test_instance():
+    spam, ham = Spam(2), Spam(3)
+
+    async def main():
+        return await asyncio.gather(
+            spam.get(1), ham.get(1), spam.get(2), ham.get(2)
+        )
+
+    assert asyncio.run(main()) == [2, 3, 4, 6]
+    assert spam.batches == [[1, 2]]
+    assert ham.batches == [[1, 2]]
+
+
+def test_classmethod():
+    async def main():
+        return await asyncio.gather(Spam.get_cls(1), Spam().get_cls(2))
+
+    assert asyncio.run(main()) == [(Spam, 1), (Spam, 2)]
+
+
+def test_max_batch_size():
+    spam = Spam()
+
+    async def main():
+        return await asyncio.gather(*(spam.get_small(key) for key in range(7)))
+
+    assert asyncio.run(main()) == list(range(7))
+    assert spam.batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_max_delay():
+    spam = Spam()
+
+    async def main():
+        first = asyncio.ensure_future(spam.get_delayed(1))
+        await asyncio.sleep(0)
+        second = spam.get_delayed(2)
+        return await asyncio.gather(first, second)
+
+    assert asyncio.run(main()) == [1, 2]
+    assert spam.batches == [[1, 2]]
+
+
+def test_separate_ticks():
+    spam = Spam()
+
+    async def main():
+        return [await spam.get(1), await spam.get(2)]
+
+    assert asyncio.run(main()) == [2, 4]
+    assert spam.batches == [[1], [2]]
+
+
+def test_exception():
+    spam = Spam()
+
+    async def main():
+        return await asyncio.gather(
+            spam.get_error(1), spam.get_error(2), return_exceptions=True
+        )
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, ValueError)
+    assert first.args == ([1, 2],)
+    assert second is first
+
+
+def test_invalid_results():
+    spam = Spam()
+
+    async def main():
+        return await asyncio.gather(
+            spam.get_invalid(1), spam.get_invalid(2), return_exceptions=True
+        )
+
+    assert all(isinstance(res, ValueError) for res in asyncio.run(main()))
+
+
+def test_cancelled_caller():
+    spam = Spam()
+
+    async def main():
+        first = asyncio.ensure_future(spam.get(1))
+        second = asyncio.ensure_future(spam.get(2))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == 4
+    assert spam.batches == [[1, 2]]
+
+
+def test_single_key():
+    async def main():
+        await Spam().get(1, 2)
+
+    with pytest.raises(TypeError):
+        asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "kwargs", [dict(max_batch_size=0), dict(max_delay=-1.0)]
+)
+def test_invalid_params(kwargs):
+    with pytest.raises(ValueError):
+
+        @Coalesce(**kwargs)
+        async def ham(keys):
+            ...
+
+
+def test_not_async():
+    with pytest.raises(TypeError):
+
+        @Coalesce
+        def ham(keys):
+            ...
@@ -1,3 +1,5 @@
+import inspect
+import weakref
 from typing import Optional
 
 import pytest
@@ -188,3 +190,464 @@ def test_repr():
     assert str(obj.staticmethod) == "<bound staticmethod>"
 
     assert str(ham) == "<function>"
+
+
+def test_rebind_state():
+    obj = Spam()
+    first, second = obj.method, obj.method
+
+    assert first is not second
+    assert first == second
+    assert first.is_bound and second.is_bound
+    assert first.decorated == second.decorated == "Spam.method"
+    assert second.__self__ is obj
+    assert second.bound_to is obj
+
+    other = Spam()
+    assert other.method.__self__ is other
+    assert other.method.bound_to is other
+
+
+def test_rebind_invalidate():
+    class Eggs:
+        @MyDecorator
+        def method(self):
+            ...
+
+    obj = Eggs()
+    assert obj.method.decorated == Eggs.method.__qualname__
+
+    Eggs.method.decorated = "changed"
+    assert obj.method.decorated == "changed"
+
+    del Eggs.method.decorated
+    assert obj.method.decorated is None
+
+
+def test_rebind_no_reference():
+    obj = Spam()
+    obj.method()
+    obj.method()
+    ref = weakref.ref(obj)
+
+    del obj
+    assert ref() is None
+
+
+@pytest.mark.parametrize(
+    "fn", [Spam().method, Spam.classmethod, Spam.staticmethod, eggs, ham]
+)
+def test_call_variant(fn):
+    assert type(fn) is MyDecorator
+    assert fn.__wrapped__ is fn.__func__
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        Spam.method,
+        Spam.__dict__["classmethod"],
+        Spam.__dict__["staticmethod"],
+    ],
+)
+def test_call_variant_unbound(fn):
+    assert type(fn) is MyDecorator
+
+
+def test_call_variant_signature():
+    @MyDecorator
+    def spam(a, b=1, *, c):
+        ...
+
+    assert str(inspect.signature(spam)) == "(a, b=1, *, c)"
+    assert str(inspect.signature(Spam().method)) == "()"
+
+
+def test_call_variant_subclass_hooks():
+    registry = []
+
+    class Tagged(Decorator):
+        def __init_subclass__(cls, /, tag, **kwargs):
+            super().__init_subclass__(**kwargs)
+            registry.append((cls, tag))
+
+    class Spam(Tagged, tag="spam"):
+        def __call_inner__(self, *args, **kwargs):
+            return super().__call_inner__(*args, **kwargs) + 1
+
+    @Spam
+    def spam():
+        return 1
+
+    assert spam() == 2
+    assert type(spam) is Spam
+    assert registry == [(Spam, "spam")]
+
+
+class Register(Decorator):
+    def __decorate__(self, **kwargs):
+        self.registered = True
+
+
+class Bacon:
+    @Register
+    def method(self):
+        return inspect.currentframe().f_back
+
+    @Register  # noqa
+    @classmethod
+    def classmethod(cls):
+        return inspect.currentframe().f_back
+
+
+@Register
+def bacon():
+    return inspect.currentframe().f_back
+
+
+@pytest.mark.parametrize(
+    "fn", [Bacon().method, Bacon.classmethod, Bacon().classmethod, bacon]
+)
+def test_passthrough(fn):
+    assert Register.__decorator_passthrough__
+    assert not MyDecorator.__decorator_passthrough__
+
+    assert fn.registered
+    assert fn.is_function or fn.is_bound
+    # no frames in between
+    assert fn() is inspect.currentframe()
+
+
+class Sum(Decorator):
+    def __call_inner__(self, *args, **kwargs):
+        return sum(super().__call_inner__(*args, **kwargs))
+
+    def __call_batch__(self, args_list):
+        self.batch_sizes = getattr(self, "batch_sizes", []) + [len(args_list)]
+        return super().__call_batch__(args_list)
+
+
+@Sum
+def pair(a, b):
+    return a, b
+
+
+def test_batch():
+    assert pair.batch([(1, 2), (3, 4)]) == [3, 7]
+    assert pair.batch(iter([(5, 6)])) == [11]
+    assert pair.batch([]) == []
+
+
+def test_map():
+    pair.batch_sizes = []
+    res = pair.map(((i, i) for i in range(5)), chunksize=2)
+    assert pair.batch_sizes == []
+
+    assert list(res) == [0, 2, 4, 6, 8]
+    assert pair.batch_sizes == [2, 2, 1]
+
+    with pytest.raises(ValueError):
+        pair.map([], chunksize=0)
+
+
+def test_batch_method():
+    obj = Spam()
+    assert obj.method.batch([()]) == [FunctionType.INSTANCEMETHOD_BOUND]
+    assert list(Spam.classmethod.map([()])) == [FunctionType.CLASSMETHOD_BOUND]
+
+    # passthrough calls are made from the batch loop directly
+    (frame,) = Bacon().method.batch([()])
+    assert frame.f_code.co_name == "__call_batch__"
+
+
+@pytest.mark.parametrize(
+    "fn", [Spam.method, Spam.__dict__["classmethod"], MyDecorator()]
+)
+def test_batch_not_callable(fn):
+    with pytest.raises(TypeError):
+        fn.batch([()])
+    with pytest.raises(TypeError):
+        fn.map([()])
+
+
+class Add(Decorator):
+    n: int = 1
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) + self.n
+
+    def __bind__(self, instance):
+        self.bound_to = instance
+        instance.binds = getattr(instance, "binds", ()) + (self.n,)
+
+
+class Stacked:
+    @Add(100)
+    @Add(10)
+    @Add
+    def method(self):
+        return 0
+
+    @Add(10)  # noqa
+    @Add
+    @classmethod
+    def classmethod(cls):
+        return 0
+
+    @Add(10)  # noqa
+    @Add
+    @staticmethod
+    def staticmethod():
+        return 0
+
+
+def test_stacked():
+    obj = Stacked()
+    bound = obj.method
+    assert bound() == 111
+    assert obj.binds == (1, 10, 100)
+
+    layer = bound
+    for n in (100, 10, 1):
+        assert isinstance(layer, Add)
+        assert layer.n == n
+        assert layer.is_bound
+        assert layer.__self__ is obj
+        assert layer.bound_to is obj
+        layer = layer.__func__
+    innermost = Stacked.__dict__["method"].__func__.__func__
+    assert layer.__func__ is innermost.__func__
+
+    assert Stacked.method is Stacked.__dict__["method"]
+
+    for name in ("classmethod", "staticmethod"):
+        unbound = Stacked.__dict__[name]
+        assert unbound.is_unbound and unbound.__func__.is_unbound
+
+        Stacked.binds = ()
+        try:
+            bound = getattr(Stacked, name)
+            assert Stacked.binds == (1, 10)
+        finally:
+            del Stacked.binds
+        assert bound() == 11
+
+        layer = bound
+        for n in (10, 1):
+            assert layer.n == n
+            assert layer.is_bound
+            assert layer.bound_to is Stacked
+            layer = layer.__func__
+    assert obj.staticmethod() == 11
+
+
+def test_stacked_invalidate():
+    class Eggs:
+        @Add(10)
+        @Add
+        def method(self):
+            return 0
+
+    obj = Eggs()
+    assert obj.method() == 11
+    Eggs.__dict__["method"].__func__.n = 2
+    assert obj.method() == 12
+
+
+def test_stacked_no_reference():
+    class Outer(Decorator):
+        pass
+
+    class Eggs:
+        # the attributes of the inner binding are copied to the outer one
+        @Outer
+        @Add
+        def method(self):
+            return 0
+
+    obj, other = Eggs(), Eggs()
+    assert obj.method.bound_to is obj
+    assert other.method.bound_to is other
+    ref = weakref.ref(obj)
+
+    del obj
+    assert ref() is None
+
+
+class Owned:
+    @Add
+    def method(self):
+        return 0
+
+    @Add(3)
+    def helper(x):
+        return x
+
+    @Add(10)  # noqa
+    @Add
+    @classmethod
+    def stacked_classmethod(cls):
+        return 0
+
+    @Add(10)  # noqa
+    @Add
+    @staticmethod
+    def stacked_staticmethod():
+        return 0
+
+    @Add  # noqa
+    @classmethod
+    def classmethod(cls):
+        return 0
+
+    @Add  # noqa
+    @staticmethod
+    def staticmethod():
+        return 0
+
+    @Add(10)
+    @Add
+    def stacked(self):
+        return 0
+
+    partial = Add(2)
+
+
+def test_owner_instancemethod():
+    obj = Owned()
+    assert obj.method() == 1
+    assert obj.method.bound_to is obj
+    assert obj.method is not obj.method
+    assert obj.stacked() == 11
+    assert isinstance(Owned.__dict__["partial"], Add)
+
+
+def test_owner_function():
+    # like a function in a class body, without `self` it's not a method
+    assert Owned.__dict__["helper"].is_function
+    assert Owned.helper(3) == 6
+
+
+@pytest.mark.parametrize("name", ["classmethod", "staticmethod"])
+def test_owner_binding_cached(name):
+    obj = Owned()
+    # invalidates the binding, which is then cached from the first access
+    Owned.__dict__[name].n = 1
+    Owned.binds = ()
+    try:
+        bound = getattr(Owned, name)
+        copies = [getattr(Owned, name), getattr(obj, name)]
+        assert Owned.binds == (1,)
+        assert "binds" not in vars(obj)
+    finally:
+        del Owned.binds
+
+    assert bound.is_bound
+    assert bound.bound_to is Owned
+    for copy in copies:
+        assert copy is not bound
+        assert copy == bound
+        assert copy.bound_to is Owned
+        assert copy() == 1
+
+    class Sub(Owned):
+        pass
+
+    sub_bound = getattr(Sub, name)
+    assert sub_bound is not bound
+    assert sub_bound.bound_to is Sub
+    assert getattr(Sub, name) is not sub_bound
+    # also bound to the class through an instance of a subclass
+    sub_obj = Sub()
+    assert getattr(sub_obj, name).bound_to is Sub
+    assert "binds" not in vars(sub_obj)
+
+
+@pytest.mark.parametrize("name", ["classmethod", "staticmethod"])
+def test_owner_binding_instance(name):
+    # the binding that's cached through an instance is bound to the class
+    obj = Owned()
+    ref = weakref.ref(obj)
+    Owned.__dict__[name].n = 2
+    try:
+        bound = getattr(obj, name)
+        assert bound.bound_to is Owned
+        assert getattr(Owned, name) == bound
+
+        del obj
+        assert ref() is None
+        assert getattr(Owned, name).bound_to is Owned
+    finally:
+        Owned.__dict__[name].n = 1
+
+
+def test_owner_binding_invalidate():
+    assert Owned.classmethod() == 1
+
+    decorator = Owned.__dict__["classmethod"]
+    decorator.n = 3
+    try:
+        assert Owned.classmethod() == 3
+    finally:
+        decorator.n = 1
+    assert Owned.classmethod() == 1
+
+
+def test_owner_binding_not_shared():
+    class Counted(Decorator):
+        def __call_inner__(self, *args, **kwargs):
+            self.count = getattr(self, "count", 0) + 1
+            return super().__call_inner__(*args, **kwargs)
+
+    class Eggs:
+        @Counted  # noqa
+        @classmethod
+        def method(cls):
+            return cls
+
+    assert Eggs.method() is Eggs
+    assert Eggs.method() is Eggs
+    # each access returns a new binding, like for instance methods
+    assert not hasattr(Eggs.method, "count")
+    assert not hasattr(Eggs().method, "count")
+
+
+@pytest.mark.parametrize(
+    "name", ["stacked_classmethod", "stacked_staticmethod"]
+)
+def test_owner_binding_stacked(name):
+    obj = Owned()
+    ref = weakref.ref(obj)
+    inner = Owned.__dict__[name].__func__
+    inner.n = 1
+    Owned.binds = ()
+    try:
+        bound = getattr(obj, name)
+        copy = getattr(Owned, name)
+        assert Owned.binds == (1, 10)
+    finally:
+        del Owned.binds
+    assert "binds" not in vars(obj)
+    assert copy is not bound
+    assert copy == bound
+    assert copy() == bound() == 11
+
+    for layer in (bound, copy):
+        for n in (10, 1):
+            assert layer.n == n
+            assert layer.bound_to is Owned
+            layer = layer.__func__
+    # the inner layers are copied as well
+    assert copy.__func__ is not bound.__func__
+    assert copy.__wrapped__ is copy.__func__
+
+    # changing an inner layer invalidates the cached binding
+    inner.n = 2
+    try:
+        assert getattr(obj, name)() == 12
+    finally:
+        inner.n = 1
+    assert getattr(Owned, name)() == 11
+
+    del obj, bound, layer
+    assert ref() is None
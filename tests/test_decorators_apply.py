@@ -0,0 +1,137 @@
+import pytest
+
+from classy_decorators import Decorator, Memoize
+from classy_decorators.function_types import FunctionType
+
+
+class Multiply(Decorator):
+    factor: int = 2
+
+    def __decorate__(self, **kwargs):
+        self.decorated = True
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+class Spam:
+    value = 3
+
+    def method(self):
+        return self.value
+
+    def method_this(this):
+        return this.value
+
+    def helper(x):
+        return x
+
+    @classmethod
+    def classmethod(cls):
+        return cls.value
+
+    @staticmethod
+    def staticmethod():
+        return 1
+
+    def _private(self):
+        return 1
+
+    def __len__(self):
+        return 1
+
+    @Memoize
+    def memoized(self):
+        return 1
+
+    @property
+    def prop(self):
+        return 1
+
+    constant = 1
+
+
+Multiply.apply_to_class(Spam, factor=10)
+
+
+@pytest.mark.parametrize(
+    "name, function_type",
+    [
+        ("method", FunctionType.INSTANCEMETHOD_UNBOUND),
+        ("method_this", FunctionType.FUNCTION),
+        ("helper", FunctionType.FUNCTION),
+        ("classmethod", FunctionType.CLASSMETHOD_UNBOUND),
+        ("staticmethod", FunctionType.STATICMETHOD_UNBOUND),
+    ],
+)
+def test_apply(name, function_type):
+    decorator = Spam.__dict__[name]
+    assert isinstance(decorator, Multiply)
+    assert decorator.function_type is function_type
+    assert decorator.factor == 10
+    assert decorator.decorated
+    assert decorator.__qualname__ == f"Spam.{name}"
+
+
+def test_apply_call():
+    spam = Spam()
+    assert spam.method() == 30
+    # like when decorated separately
+    assert spam.method_this() == 30
+    assert spam.method_this.is_instancemethod
+    assert Spam.helper(3) == 30
+    assert Spam.classmethod() == 30
+    assert Spam.staticmethod() == 10
+    assert spam.staticmethod() == 10
+
+
+def test_apply_skipped():
+    assert not isinstance(Spam.__dict__["_private"], Decorator)
+    assert not isinstance(Spam.__dict__["__len__"], Decorator)
+    assert isinstance(Spam.__dict__["memoized"], Memoize)
+    assert isinstance(Spam.__dict__["prop"], property)
+    assert Spam.constant == 1
+
+
+def test_apply_include_exclude():
+    @Multiply.apply_to_class(include=["get_*", "_private"], exclude=["*_no"])
+    class Ham:
+        def get_one(self):
+            return 1
+
+        def get_no(self):
+            return 1
+
+        def set_one(self):
+            return 1
+
+        def _private(self):
+            return 1
+
+    ham = Ham()
+    assert ham.get_one() == 2
+    assert ham._private() == 2
+    assert ham.get_no() == 1
+    assert ham.set_one() == 1
+
+
+def test_apply_class_decorator():
+    @Multiply.apply_to_class
+    class Ham:
+        def method(self):
+            return 1
+
+    assert Ham().method() == 2
+
+
+def test_apply_param_errors():
+    class Ham:
+        def method(self):
+            ...
+
+    with pytest.raises(TypeError):
+        Multiply.apply_to_class(Ham, factor="spam")
+    with pytest.raises(ValueError):
+        Multiply.apply_to_class(Ham, spam=1)
+
+    assert not isinstance(Ham.__dict__["method"], Decorator)
@@ -0,0 +1,124 @@
+import asyncio
+import inspect
+import sys
+
+import pytest
+
+from classy_decorators import Decorator
+from classy_decorators.function_types import is_coroutinefunction
+
+
+class Multiply(Decorator):
+    factor: int = 2
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+    async def __call_inner_async__(self, *args, **kwargs):
+        res = await super().__call_inner_async__(*args, **kwargs)
+        return res * self.factor
+
+
+class Register(Decorator):
+    def __decorate__(self, **kwargs):
+        self.registered = True
+
+
+class Spam:
+    value = 21
+
+    @Multiply
+    async def method(self):
+        return self.value
+
+    @Multiply  # noqa
+    @classmethod
+    async def classmethod(cls):
+        return cls.value
+
+    @Multiply  # noqa
+    @staticmethod
+    async def staticmethod():
+        return 21
+
+    @Register
+    async def registered(self):
+        return self.value
+
+
+@Multiply
+async def eggs():
+    return 21
+
+
+@Multiply
+def ham():
+    return 21
+
+
+@Multiply
+@Register
+async def stacked():
+    return 21
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        Spam().method,
+        Spam.classmethod,
+        Spam().classmethod,
+        Spam.staticmethod,
+        eggs,
+        stacked,
+    ],
+)
+def test_call_async(fn):
+    assert fn.is_coroutinefunction
+    assert is_coroutinefunction(fn)
+    # function-like objects are recognized since Python 3.10
+    if sys.version_info >= (3, 10):
+        assert inspect.iscoroutinefunction(fn)
+    assert asyncio.run(fn()) == 42
+
+
+def test_call_sync():
+    assert not ham.is_coroutinefunction
+    assert not is_coroutinefunction(ham)
+    assert not inspect.iscoroutinefunction(ham)
+    assert ham() == 42
+
+
+def test_call_async_passthrough():
+    obj = Spam()
+    coro = obj.registered()
+
+    # the coroutine of the wrapped method itself
+    assert coro.cr_code is obj.registered.__func__.__code__
+    assert asyncio.run(coro) == 21
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        Spam.method,
+        Spam.__dict__["classmethod"],
+        Spam.__dict__["staticmethod"],
+    ],
+)
+def test_unbound(fn):
+    assert fn.is_coroutinefunction
+    assert is_coroutinefunction(fn)
+
+
+@pytest.mark.parametrize(
+    "fn,res",
+    [
+        (Spam.__dict__["classmethod"].__func__, True),
+        (Spam.__dict__["staticmethod"].__func__, True),
+        (ham.__func__, False),
+        (len, False),
+    ],
+)
+def test_is_coroutinefunction(fn, res):
+    assert is_coroutinefunction(fn) is res
@@ -0,0 +1,210 @@
+import asyncio
+import inspect
+import sys
+
+import pytest
+
+from classy_decorators import Decorator
+from classy_decorators.function_types import (
+    is_asyncgenfunction,
+    is_generatorfunction,
+)
+
+
+class Double(Decorator):
+    def __yield_inner__(self, item):
+        return item * 2
+
+
+class Spam:
+    @Double
+    def method(self, n):
+        yield from range(n)
+
+    @Double  # noqa
+    @classmethod
+    def classmethod(cls, n):
+        yield from range(n)
+
+    @Double
+    async def method_async(self, n):
+        for i in range(n):
+            yield i
+
+
+@Double
+def echo():
+    received = []
+    try:
+        while (value := (yield len(received))) is not None:
+            received.append(value)
+    except KeyError:
+        yield -1
+    finally:
+        received.append("closed")
+    return received
+
+
+@Double
+async def echo_async(events):
+    try:
+        yield 1
+        yield 2
+    except KeyError:
+        events.append("except")
+        yield -1
+    except ValueError:
+        events.append("return")
+    finally:
+        events.append("finally")
+
+
+@Double
+def count(n):
+    return n
+
+
+@Double
+@Double
+def stacked(n):
+    yield from range(n)
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+@pytest.mark.parametrize("fn", [Spam().method, Spam.classmethod])
+def test_generator(fn):
+    assert fn.is_generatorfunction
+    assert is_generatorfunction(fn)
+    # function-like objects are recognized since Python 3.10
+    if sys.version_info >= (3, 10):
+        assert inspect.isgeneratorfunction(fn)
+
+    gen = fn(3)
+    assert inspect.isgenerator(gen)
+    assert list(gen) == [0, 2, 4]
+
+
+def test_generator_lazy():
+    gen = Spam().method(10 ** 12)
+    assert next(gen) == 0
+    assert next(gen) == 2
+
+
+def test_generator_send():
+    gen = echo()
+    assert next(gen) == 0
+    assert gen.send("spam") == 2
+    assert gen.send("ham") == 4
+
+    with pytest.raises(StopIteration) as exc_info:
+        gen.send(None)
+    assert exc_info.value.value == ["spam", "ham", "closed"]
+
+
+def test_generator_throw_close():
+    gen = echo()
+    next(gen)
+    assert gen.throw(KeyError()) == -2
+
+    gen.close()
+    assert inspect.getgeneratorstate(gen) == inspect.GEN_CLOSED
+
+
+def test_not_generator():
+    assert not count.is_generatorfunction
+    assert count(3) == 3
+
+
+def test_stacked():
+    assert stacked.is_generatorfunction
+    assert list(stacked(3)) == [0, 4, 8]
+
+
+def test_asyncgen():
+    obj = Spam()
+    assert obj.method_async.is_asyncgenfunction
+    assert is_asyncgenfunction(obj.method_async)
+    if sys.version_info >= (3, 10):
+        assert inspect.isasyncgenfunction(obj.method_async)
+    assert asyncio.run(_collect(obj.method_async(3))) == [0, 2, 4]
+    assert asyncio.run(_collect(obj.method_async(0))) == []
+
+
+def test_asyncgen_aclose():
+    async def main():
+        agen = Spam().method_async(3)
+        assert await agen.__anext__() == 0
+        await agen.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await agen.__anext__()
+
+    asyncio.run(main())
+
+
+def test_asyncgen_athrow_aclose():
+    events = []
+
+    async def main():
+        agen = echo_async(events)
+        assert await agen.__anext__() == 2
+        assert await agen.athrow(KeyError()) == -2
+        assert events == ["except"]
+        await agen.aclose()
+        assert events == ["except", "finally"]
+
+    asyncio.run(main())
+
+
+def test_asyncgen_athrow_return():
+    events = []
+
+    async def main():
+        agen = echo_async(events)
+        await agen.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await agen.athrow(ValueError())
+
+    asyncio.run(main())
+    assert events == ["return", "finally"]
+
+
+def test_asyncgen_athrow_unhandled():
+    events = []
+
+    async def main():
+        agen = echo_async(events)
+        await agen.__anext__()
+        with pytest.raises(TypeError):
+            await agen.athrow(TypeError())
+
+    asyncio.run(main())
+    assert events == ["finally"]
+
+
+def test_asyncgen_aclose_finally():
+    events = []
+
+    async def main():
+        agen = echo_async(events)
+        await agen.__anext__()
+        await agen.aclose()
+        assert events == ["finally"]
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "fn,generator,asyncgen",
+    [
+        (Spam.__dict__["classmethod"], True, False),
+        (Spam.method_async, False, True),
+        (count, False, False),
+        (stacked, True, False),
+    ],
+)
+def test_function_types(fn, generator, asyncgen):
+    assert is_generatorfunction(fn) is generator
+    assert is_asyncgenfunction(fn) is asyncgen
@@ -1,7 +1,6 @@
-import importlib
 import sys
 from importlib.abc import MetaPathFinder
-from typing import Optional
+from typing import Callable, Optional, Sequence, Union
 
 import pytest
 
@@ -101,6 +100,33 @@ def test_inheritance():
     assert subspam.bacon == 6.66
 
 
+def test_inheritance_callable_default():
+    def base_hook():
+        ...
+
+    def sub_hook():
+        ...
+
+    class Base(decorators.Decorator):
+        hook: Callable[[], None] = base_hook
+
+    class Sub(Base):
+        # a function is a descriptor, but also the new default of the param
+        hook = sub_hook
+
+        def method(self):
+            ...
+
+    assert Sub.__decorator_params__["hook"].default is sub_hook
+    assert "method" not in Sub.__decorator_params__
+
+    @Sub
+    def spam():
+        ...
+
+    assert spam.hook is sub_hook
+
+
 def test_missing():
     with pytest.raises(TypeError):
 
@@ -175,23 +201,128 @@ def test_type_error_param():
         MyDecorator(spam=6)
 
 
-def test_no_typeguard():
+class TypedDecorator(decorators.Decorator):
+    number: float = 1.0
+    optional: Optional[int] = None
+    union: Union[str, bytes] = "spam"
+    sequence: Sequence[int] = ()
+
+
+@pytest.mark.parametrize(
+    "name,value,valid",
+    [
+        ("number", 2.5, True),
+        ("number", 2, True),
+        ("number", "2", False),
+        ("optional", 6, True),
+        ("optional", None, True),
+        ("optional", 6.0, False),
+        ("union", b"spam", True),
+        ("union", 6, False),
+        ("sequence", [1, 2], True),
+        ("sequence", 6, False),
+    ],
+)
+def test_param_check_type(name, value, valid):
+    param = TypedDecorator.__decorator_params__[name]
+    assert param.is_of_type(value) is valid
+
+    if valid:
+        assert getattr(TypedDecorator(**{name: value}), name) == value
+    else:
+        with pytest.raises(TypeError):
+            TypedDecorator(**{name: value})
+
+
+def test_param_checker_cached():
+    class OtherDecorator(decorators.Decorator):
+        spam: Optional[int] = None
+
+    checker = TypedDecorator.__decorator_params__["optional"].checker
+    assert OtherDecorator.__decorator_params__["spam"].checker is checker
+
+
+def test_no_typeguard(monkeypatch):
     # mock import error for typeguard
     class ImportRaiser(MetaPathFinder):
         def find_spec(self, fullname, path, target=None):
             if fullname == "typeguard":
                 raise ImportError
 
-    sys.meta_path.insert(0, ImportRaiser())
-    del sys.modules["typeguard"]
-    importlib.reload(decorators)
+    monkeypatch.setattr(sys, "meta_path", [ImportRaiser(), *sys.meta_path])
+    monkeypatch.delitem(sys.modules, "typeguard", raising=False)
+    decorators._typeguard.cache_clear()
+
+    try:
+        assert decorators._typeguard() is None
+
+        class _Decorator(decorators.Decorator):
+            spam: Sequence[bytes] = ()
+
+        param = _Decorator.__decorator_params__["spam"]
+        assert param.is_of_type([b"spam"])
+        assert not param.is_of_type(6)
+
+        with pytest.raises(TypeError):
 
-    assert not decorators._TYPEGUARD
+            class _DecoratorDefault(decorators.Decorator):
+                spam: str = 6
+
+        with pytest.raises(TypeError):
+            MyDecorator(spam=6)
+    finally:
+        decorators._typeguard.cache_clear()
+
+
+def test_inherited_params_shared():
+    params = SubDecorator.__decorator_params__
+    base_params = MyDecorator.__decorator_params__
+    assert params["ham"] is base_params["ham"]
+    assert params["eggs"] is base_params["eggs"]
+    assert params["spam"] is not base_params["spam"]
+    assert params["spam"].default == "defaultspam"
+    assert params["spam"].owner is MyDecorator
+    assert params["bacon"].owner is SubDecorator
+
+
+def test_string_annotation():
+    class _Decorator(decorators.Decorator):
+        spam: "int" = 6
+
+    param = _Decorator.__decorator_params__["spam"]
+    assert param.checker is None
+    assert param.type == "int"
+    assert not _Decorator.__decorator_resolved__
+
+    @_Decorator
+    def eggs():
+        ...
+
+    assert _Decorator.__decorator_resolved__
+    assert param.type is int
+    assert param.checker is not None
+    assert eggs.spam == 6
 
     with pytest.raises(TypeError):
+        _Decorator(spam="spam")
 
-        class _Decorator(decorators.Decorator):
-            spam: str = 6
+
+def test_string_annotation_default_error():
+    class _Decorator(decorators.Decorator):
+        spam: "int" = "spam"
+
+    class _SubDecorator(_Decorator):
+        spam = 6
+
+    assert _SubDecorator(spam=1).spam == 1
 
     with pytest.raises(TypeError):
-        MyDecorator(spam=6)
+        _Decorator(spam=1)
+
+
+def test_string_annotation_name_error():
+    class _Decorator(decorators.Decorator):
+        spam: "Undefined" = None  # noqa: F821
+
+    with pytest.raises(NameError):
+        _Decorator.__decorator_params__["spam"].is_of_type(None)
@@ -0,0 +1,177 @@
+import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from classy_decorators import Decorator, Memoize
+
+
+class Multiply(Decorator):
+    factor: int = 2
+
+    def __decorate__(self, **kwargs):
+        self.decorations = getattr(self, "decorations", 0) + 1
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+class MultiplySlotted(Decorator):
+    __slots__ = ()
+
+    factor: int = 2
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+@Multiply(factor=3)
+def eggs(n):
+    return n
+
+
+@MultiplySlotted
+def ham(n):
+    return n
+
+
+@Memoize
+def bacon(n):
+    return n
+
+
+class Spam:
+    def __init__(self, n=1):
+        self.n = n
+
+    @Multiply
+    def method(self):
+        return self.n
+
+    @MultiplySlotted  # noqa
+    @classmethod
+    def classmethod(cls):
+        return 1
+
+    @Multiply  # noqa
+    @staticmethod
+    def staticmethod():
+        return 1
+
+
+def _roundtrip(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        eggs,
+        ham,
+        bacon,
+        Spam.__dict__["method"],
+        Spam.__dict__["classmethod"],
+        Spam.__dict__["staticmethod"],
+    ],
+)
+def test_by_reference(fn):
+    assert _roundtrip(fn) is fn
+
+
+@pytest.mark.parametrize(
+    "get",
+    [
+        lambda spam: spam.method,
+        lambda spam: spam.classmethod,
+        lambda spam: Spam.classmethod,
+        lambda spam: spam.staticmethod,
+        lambda spam: Spam.staticmethod,
+    ],
+)
+def test_bound(get):
+    spam = Spam(21)
+    bound = get(spam)
+    res = _roundtrip(bound)
+    assert type(res) is type(bound)
+    assert res.function_type is bound.function_type
+    assert res() == bound()
+
+
+def test_bound_instance():
+    res = _roundtrip(Spam(21).method)
+    assert isinstance(res.__self__, Spam)
+    assert res.__self__.n == 21
+    assert res() == 42
+
+
+def test_unbound_instancemethod():
+    assert _roundtrip(Spam.method) is Spam.__dict__["method"]
+
+
+def test_params():
+    bound = Spam(21).method
+    bound.factor = 3
+    res = _roundtrip(bound)
+    assert res.factor == 3
+    assert res() == 63
+    assert Spam(21).method() == 42
+
+
+def test_params_no_decorate():
+    decorations = eggs.decorations
+    eggs.factor = 4
+    try:
+        data = pickle.dumps(eggs)
+    finally:
+        eggs.factor = 3
+
+    res = pickle.loads(data)
+
+    assert res is not eggs
+    assert res.factor == 4
+    assert res(2) == 8
+    assert res.decorations == decorations
+    assert eggs.decorations == decorations
+
+
+def test_partial():
+    res = _roundtrip(Multiply(factor=5))
+    assert isinstance(res, Multiply)
+    assert res.factor == 5
+    assert res(lambda: 1)() == 5
+
+
+def test_not_found():
+    @Multiply
+    def spam():
+        ...
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(spam)
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_copy(copier):
+    @Multiply
+    def spam():
+        return 1
+
+    # not found by reference, but copied like a function
+    assert copier(spam) is spam
+    assert copier([spam])[0] is spam
+    bound = Spam(21).method
+    assert copier(bound) is bound
+    partial = Multiply(factor=5)
+    assert copier(partial) is partial
+
+
+def _call(fn, *args):
+    return fn(*args)
+
+
+def test_process_pool():
+    with ProcessPoolExecutor(2) as executor:
+        assert list(executor.map(eggs, [1, 2])) == [3, 6]
+        assert executor.submit(_call, Spam(2).method).result() == 4
+        assert executor.submit(_call, Spam.staticmethod).result() == 2
@@ -0,0 +1,198 @@
+import inspect
+import typing
+import tracemalloc
+
+import pytest
+
+from classy_decorators import Decorator
+
+
+class Multiply(Decorator):
+    """Multiplies the result."""
+
+    __slots__ = ("calls",)
+
+    factor: int = 2
+
+    def __decorate__(self, **kwargs):
+        self.calls = 0
+
+    def __call_inner__(self, *args, **kwargs):
+        self.calls += 1
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+class MultiplyDict(Decorator):
+    factor: int = 2
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+class Spam:
+    @Multiply(factor=3)
+    def method(self, n: int) -> int:
+        """Returns n."""
+        return n
+
+    @Multiply  # noqa
+    @classmethod
+    def classmethod(cls, n):
+        return n
+
+    @Multiply  # noqa
+    @staticmethod
+    def staticmethod(n):
+        return n
+
+    @MultiplyDict
+    def method_dict(self, n):
+        return n
+
+
+def eggs(a, b=1, *, c=2):
+    """Returns a."""
+    return a
+
+
+setattr(eggs, "marker", "eggs")
+eggs_multiplied = Multiply(eggs)
+
+
+def test_slotted():
+    assert Multiply.__decorator_slotted__
+    assert not MultiplyDict.__decorator_slotted__
+    assert Multiply.__decorator_slots__ == ("calls",)
+
+    for fn in (Spam.method, Spam().method, Spam.classmethod, eggs_multiplied):
+        assert not hasattr(fn, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "fn, factor",
+    [
+        (Spam().method, 3),
+        (Spam.classmethod, 2),
+        (Spam().staticmethod, 2),
+        (eggs_multiplied, 2),
+    ],
+)
+def test_call(fn, factor):
+    assert fn(2) == 2 * factor
+    assert fn.factor == factor
+    assert fn.calls == 1
+
+
+@pytest.mark.parametrize(
+    "fn", [Spam.__dict__["method"], Spam.method, Spam().method]
+)
+def test_function_attributes(fn):
+    function = Spam.__dict__["method"].__func__
+    assert isinstance(fn, Multiply)
+    assert fn.__name__ == "method"
+    assert fn.__qualname__ == "Spam.method"
+    assert fn.__module__ == __name__
+    assert fn.__doc__ == "Returns n."
+    assert fn.__annotations__ == {"n": int, "return": int}
+    assert fn.__code__ is function.__code__
+    assert getattr(fn.__wrapped__, "__func__", fn.__wrapped__) is function
+    assert str(inspect.signature(fn)).endswith("n: int) -> int")
+
+
+def test_function_attributes_function():
+    assert eggs_multiplied.__wrapped__ is eggs
+    assert eggs_multiplied.__defaults__ == (1,)
+    assert eggs_multiplied.__kwdefaults__ == {"c": 2}
+    assert eggs_multiplied.marker == "eggs"
+    assert str(inspect.signature(eggs_multiplied)) == "(a, b=1, *, c=2)"
+
+    with pytest.raises(AttributeError):
+        _ = eggs_multiplied.nope
+
+
+def test_class_attributes():
+    assert type(eggs_multiplied) is Multiply
+    assert Multiply.__doc__ == "Multiplies the result."
+    assert Multiply.__module__ == __name__
+    assert Multiply.factor == 2
+    assert typing.get_type_hints(Multiply)["factor"] is int
+    assert Multiply().__doc__ == "Multiplies the result."
+
+
+def test_params():
+    obj = Spam()
+    bound, other = obj.method, obj.method
+    bound.factor = 5
+    assert bound(1) == 5
+    assert other(1) == 3
+    assert obj.method(1) == 3
+
+    del bound.factor
+    with pytest.raises(AttributeError):
+        _ = bound.factor
+
+
+def test_params_invalidate():
+    class Ham:
+        @Multiply
+        def method(self):
+            return 1
+
+    assert Ham().method() == 2
+    Ham.method.factor = 4
+    assert Ham().method() == 4
+
+
+def test_state():
+    obj = Spam()
+    first = obj.method
+    first(1)
+    assert first.calls == 1
+    assert obj.method.calls == 0
+
+    unbound = Spam.__dict__["method"]
+    assert unbound.calls == 0
+    unbound.calls = 10
+    assert obj.method.calls == 10
+
+
+def test_partial():
+    partial = Multiply(factor=4)
+    assert partial.factor == 4
+    assert not hasattr(partial, "__func__")
+    assert partial(eggs)(1) == 4
+
+
+def test_subclass():
+    class MultiplyDictSub(Multiply):
+        offset: int = 0
+
+        def __call_inner__(self, *args, **kwargs):
+            return super().__call_inner__(*args, **kwargs) + self.offset
+
+    @MultiplyDictSub(offset=1)
+    def ham(n):
+        return n
+
+    assert not MultiplyDictSub.__decorator_slotted__
+    assert ham(2) == 5
+    assert ham.__name__ == "ham"
+
+
+def _traced_size(bind):
+    tracemalloc.start()
+    try:
+        res = [bind() for _ in range(1000)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(res) == 1000
+    return size
+
+
+def test_size():
+    obj = Spam()
+    size_dict = _traced_size(lambda: obj.method_dict)
+    size_slotted = _traced_size(lambda: obj.method)
+    assert size_slotted < size_dict * 0.6
@@ -0,0 +1,189 @@
+import random
+import sys
+import threading
+
+import pytest
+
+from classy_decorators import Decorator, Memoize
+
+THREADS = 8
+ROUNDS = 500
+
+
+@pytest.fixture(autouse=True)
+def switch_often():
+    # with GIL, make threads switch as often as possible
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def _run_threads(*targets):
+    """Runs the targets in threads that start at once, and re-raises errors."""
+    barrier = threading.Barrier(len(targets))
+    errors = []
+
+    def run(target):
+        barrier.wait()
+        try:
+            target()
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(t,)) for t in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:  # pragma: no cover
+        raise errors[0]
+
+
+class Multiply(Decorator):
+    factor: int = 2
+
+    def __bind__(self, instance):
+        self.bound_to = instance
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+class MultiplySlotted(Decorator):
+    __slots__ = ("bound_to",)
+
+    factor: int = 2
+
+    def __bind__(self, instance):
+        self.bound_to = instance
+
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * self.factor
+
+
+@pytest.mark.parametrize("decorator", [Multiply, MultiplySlotted])
+def test_bind_shared_instance(decorator):
+    class Spam:
+        @decorator(factor=3)
+        def method(self, n):
+            return n
+
+    spam = Spam()
+    types = set()
+
+    def bind():
+        for _ in range(ROUNDS):
+            bound = spam.method
+            assert bound.__self__ is spam
+            assert bound.bound_to is spam
+            assert bound.factor == 3
+            assert bound(2) == 6
+            types.add(type(bound))
+
+    _run_threads(*[bind] * THREADS)
+    assert len(types) == 1
+
+
+@pytest.mark.parametrize("decorator", [Multiply, MultiplySlotted])
+def test_bind_invalidate(decorator):
+    for _ in range(20):
+
+        class Spam:
+            @decorator
+            def method(self, n):
+                return n
+
+        unbound = Spam.__dict__["method"]
+        factors = range(2, 20)
+
+        def bind():
+            for _ in range(ROUNDS // 10):
+                assert Spam().method.factor in factors
+
+        def invalidate():
+            for factor in factors:
+                unbound.factor = factor
+
+        _run_threads(invalidate, *[bind] * (THREADS - 1))
+        assert Spam().method.factor == factors[-1]
+
+
+def test_resolve_params():
+    class Ham(Decorator):
+        spam: "int" = 6
+        eggs: "str"
+
+    def decorate():
+        for _ in range(ROUNDS // 10):
+
+            @Ham(eggs="eggs")
+            def bacon():
+                return 1
+
+            assert bacon() == 1
+            assert bacon.spam == 6
+
+    _run_threads(*[decorate] * THREADS)
+    assert Ham.__decorator_resolved__
+    assert Ham.__decorator_params__["spam"].type is int
+    assert Ham.__decorator_params__["eggs"].type is str
+
+
+def test_call_variants():
+    class Ham(Decorator):
+        def __call_inner__(self, *args, **kwargs):
+            return super().__call_inner__(*args, **kwargs)
+
+    types = set()
+
+    def decorate():
+        @Ham
+        def spam():
+            return 1
+
+        assert spam() == 1
+        types.add(type(spam))
+
+    _run_threads(*[decorate] * THREADS)
+    assert types == {Ham}
+
+
+def test_memoize_bind():
+    class Spam:
+        @Memoize
+        def method(self, n):
+            return n
+
+    spam = Spam()
+    caches = set()
+
+    def bind():
+        for _ in range(ROUNDS):
+            bound = spam.method
+            assert bound(1) == 1
+            caches.add(id(bound._cache))
+
+    _run_threads(*[bind] * THREADS)
+    assert len(caches) == 1
+    assert spam.method.cache_info().currsize == 1
+
+
+@pytest.mark.parametrize("ttl", [None, 1e-5])
+def test_memoize_calls(ttl):
+    # hits, evictions and expiries of the same keys in other threads
+    @Memoize(maxsize=4, ttl=ttl)
+    def eggs(n):
+        return n
+
+    def call():
+        rnd = random.Random()
+        for _ in range(ROUNDS * 10):
+            n = rnd.randrange(6)
+            assert eggs(n) == n
+
+    _run_threads(*[call] * THREADS)
+    assert eggs.cache_info().currsize <= 4
@@ -0,0 +1,150 @@
+import asyncio
+import gc
+import tracemalloc
+import weakref
+
+import pytest
+
+from classy_decorators import Decorator
+from classy_decorators.function_types import is_coroutinefunction
+
+
+class Double(Decorator, weak=True):
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * 2
+
+
+class Passthrough(Decorator, weak=True):
+    __slots__ = ()
+
+
+class Strong(Double, weak=False):
+    pass
+
+
+class Spam:
+    def __init__(self, value=21):
+        self.value = value
+        self.payload = bytearray(10_000)
+
+    @Double
+    def method(self, n=1):
+        """Docstring"""
+        return self.value * n
+
+    @Passthrough
+    def slotted(self):
+        return self.value
+
+    @Passthrough
+    async def method_async(self):
+        return self.value
+
+    @Double
+    @Double
+    def stacked(self):
+        return self.value
+
+    @Double  # noqa
+    @classmethod
+    def classmethod(cls):
+        return 1
+
+    @Strong
+    def strong(self):
+        return self.value
+
+
+def test_weak():
+    assert Double.__decorator_weak__
+    assert Passthrough.__decorator_weak__
+    assert not Strong.__decorator_weak__
+    assert not Decorator.__decorator_weak__
+
+
+def test_bound():
+    spam = Spam()
+    bound = spam.method
+    assert bound() == 42
+    assert bound.is_bound
+    assert bound.__self__ is spam
+    assert bound.__name__ == "method"
+    assert bound.__doc__ == "Docstring"
+    assert bound == spam.method
+    assert Spam.method > bound
+
+    assert spam.slotted() == 21
+    assert spam.slotted.__self__ is spam
+    assert spam.stacked() == 84
+    assert spam.stacked.__self__ is spam
+    assert spam.method_async.is_coroutinefunction
+    assert is_coroutinefunction(spam.method_async)
+    assert asyncio.run(spam.method_async()) == 21
+
+
+def test_classmethod():
+    spam = Spam()
+    assert Spam.classmethod() == 2
+    assert spam.classmethod.__self__ is Spam
+
+
+@pytest.mark.parametrize("name", ["method", "slotted", "stacked"])
+def test_collected(name):
+    spam = Spam()
+    ref = weakref.ref(spam)
+    bound = getattr(spam, name)
+    del spam
+    gc.collect()
+
+    assert ref() is None
+    assert "<collected>" in repr(bound)
+    with pytest.raises(ReferenceError):
+        bound()
+    with pytest.raises(ReferenceError):
+        bound.__self__
+
+
+def test_strong():
+    spam = Spam()
+    ref = weakref.ref(spam)
+    bound = spam.strong
+    del spam
+    gc.collect()
+
+    assert ref() is not None
+    assert bound() == 42
+
+
+def test_no_weakref():
+    class Ham:
+        __slots__ = ()
+
+        @Double
+        def method(self):
+            return 1
+
+    with pytest.raises(TypeError, match="weak references"):
+        Ham().method
+
+
+def test_memory():
+    # e.g. an event bus, to which many bound methods are registered
+    callbacks = []
+    refs = []
+
+    tracemalloc.start()
+    try:
+        for _ in range(1_000):
+            spam = Spam()
+            refs.append(weakref.ref(spam))
+            callbacks += [spam.method, spam.slotted, spam.stacked]
+        del spam
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(callbacks) == 3_000
+    assert not any(ref() for ref in refs)
+    # the instances have a payload of 10 KB each, i.e. 10 MB in total
+    assert retained < 1_000 * 10_000 / 4
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+ROOT = Path(__file__).parent.parent
+
+# modules that are only imported once needed
+LAZY_MODULES = {"inspect", "typeguard"}
+# generous upper bound of the import time of classy_decorators itself, i.e.
+# excluding the standard library; about 3ms with CPython 3.11
+MAX_IMPORT_TIME_US = 25_000
+
+
+def _import_times(tmp_path: Path) -> Dict[str, int]:
+    """
+    Returns the import time in microseconds of each module imported by
+    `import classy_decorators`, as reported by `python -X importtime`.
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    cmd = [sys.executable, "-X", "importtime", "-c", "import classy_decorators"]
+
+    # the first import writes the bytecode cache
+    subprocess.run(cmd, cwd=ROOT, env=env, capture_output=True, check=True)
+    res = subprocess.run(
+        cmd, cwd=ROOT, env=env, capture_output=True, check=True, text=True
+    )
+
+    times = {}
+    for line in res.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, module = line.split(":", 1)[1].split("|")
+        times[module.strip()] = int(self_us)
+    return times
+
+
+def test_import_time(tmp_path):
+    times = _import_times(tmp_path)
+
+    assert "classy_decorators" in times
+    assert not LAZY_MODULES & times.keys()
+
+    own_time = sum(
+        t
+        for module, t in times.items()
+        if module.split(".")[0] == "classy_decorators"
+    )
+    assert own_time < MAX_IMPORT_TIME_US
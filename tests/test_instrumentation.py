@@ -0,0 +1,294 @@
+import asyncio
+import math
+import tracemalloc
+
+import pytest
+
+from classy_decorators import Decorator, instrumentation
+
+
+class Timed(Decorator, instrumented=True):
+    pass
+
+
+class SubTimed(Timed):
+    def __call_inner__(self, *args, **kwargs):
+        return super().__call_inner__(*args, **kwargs) * 2
+
+
+class NotTimed(SubTimed, instrumented=False):
+    pass
+
+
+class Sampled(Decorator, sample=3):
+    pass
+
+
+class Profiled(Decorator, profile="cprofile"):
+    pass
+
+
+class Traced(Decorator, profile="tracemalloc"):
+    pass
+
+
+class Spam:
+    @Timed
+    def method(self, value):
+        return value
+
+    @Timed  # noqa
+    @classmethod
+    def classmethod(cls):
+        raise KeyError
+
+    @Timed
+    async def method_async(self, value):
+        return value
+
+
+@SubTimed
+def ham():
+    return 1
+
+
+@NotTimed
+def eggs():
+    return 1
+
+
+@Sampled
+def sampled():
+    return 1
+
+
+@Profiled
+def profiled(n):
+    return sum(range(n))
+
+
+@Traced
+def traced():
+    return bytearray(100_000)
+
+
+@Traced
+def traced_outer():
+    return traced()
+
+
+def _stats(fn):
+    function = f"{fn.__module__}.{fn.__qualname__}"
+    for stats in instrumentation.snapshot():
+        if stats["function"] == function:
+            return stats
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    instrumentation.reset()
+
+
+def test_instrumented():
+    assert Timed.__decorator_instrumented__
+    assert SubTimed.__decorator_instrumented__
+    assert not NotTimed.__decorator_instrumented__
+    assert not Decorator.__decorator_instrumented__
+
+
+def test_calls():
+    a, b = Spam(), Spam()
+    assert [a.method(1), b.method(2), a.method(1)] == [1, 2, 1]
+
+    stats = _stats(Spam.method)
+    assert stats["decorator"].endswith(".Timed")
+    assert stats["calls"] == stats["sampled_calls"] == 3
+    assert stats["sampled_errors"] == 0
+    assert len(stats["histogram"]) == len(instrumentation.BUCKETS) + 1
+    assert sum(stats["histogram"]) == 3
+
+
+def test_errors():
+    with pytest.raises(KeyError):
+        Spam.classmethod()
+    with pytest.raises(KeyError):
+        Spam().classmethod()
+
+    stats = _stats(Spam.classmethod)
+    assert stats["calls"] == stats["sampled_errors"] == 2
+
+
+def test_async():
+    assert asyncio.run(Spam().method_async(21)) == 21
+
+    stats = _stats(Spam.method_async)
+    assert stats["calls"] == 1
+
+
+def test_subclass():
+    assert ham() == 2
+
+    stats = _stats(ham)
+    assert stats["decorator"].endswith(".SubTimed")
+    assert stats["calls"] == 1
+
+
+def test_not_instrumented():
+    assert eggs() == 2
+    assert _stats(eggs) is None
+
+
+def test_reset():
+    Spam().method(1)
+    instrumentation.reset()
+
+    stats = _stats(Spam.method)
+    assert stats["calls"] == 0
+    assert sum(stats["histogram"]) == 0
+
+
+def test_record():
+    stats = instrumentation.CallStats("spam", "ham")
+    stats.record(0)
+    stats.record(int(1e9))
+    stats.record(int(1e12), error=True)
+
+    assert stats.histogram[0] == 1
+    assert stats.histogram[instrumentation.BUCKETS.index(1.0)] == 1
+    assert stats.histogram[-1] == 1
+    assert stats.errors == 1
+
+
+def test_function_type():
+    assert _stats(ham)["type"] == "function"
+    assert _stats(Spam.method)["type"] == "method"
+    assert _stats(Spam.classmethod)["type"] == "classmethod"
+
+
+def test_sampled():
+    assert Sampled.__decorator_instrumented__
+    assert Sampled.__decorator_sample__ == 3
+
+    for _ in range(7):
+        assert sampled() == 1
+
+    stats = _stats(sampled)
+    assert stats["sample"] == 3
+    # all calls are counted, but only the 3rd and 6th are recorded
+    assert stats["calls"] == 7
+    assert stats["sampled_calls"] == 2
+    assert sum(stats["histogram"]) == 2
+
+
+def test_configure():
+    stats = instrumentation.configure(ham, sample=2)
+    try:
+        for _ in range(3):
+            ham()
+        assert _stats(ham)["sampled_calls"] == 1
+    finally:
+        instrumentation.configure(ham)
+    assert stats.sample == 1
+    # including the call since the last sampled one
+    assert _stats(ham)["calls"] == 3
+
+    with pytest.raises(TypeError):
+        instrumentation.configure(eggs)
+    with pytest.raises(ValueError):
+        instrumentation.configure(ham, sample=0)
+    with pytest.raises(ValueError):
+        instrumentation.configure(ham, profile="spam")
+
+
+def test_invalid_class_sampling():
+    with pytest.raises(ValueError):
+
+        class Spam(Decorator, sample=0):
+            pass
+
+
+def test_cprofile():
+    assert profiled(1000) == sum(range(1000))
+
+    assert _stats(profiled)["calls"] == 1
+    report = instrumentation.report(limit=2)
+    assert f"{profiled.__module__}.{profiled.__qualname__}" in report
+    assert "function calls" in report
+    # only the call itself is profiled, not its recording
+    assert "(profiled)" in report
+    assert "record" not in report
+
+
+def test_tracemalloc():
+    traced()
+
+    stats = _stats(traced)
+    assert stats["calls"] == 1
+    # the returned bytearray is still allocated
+    assert stats["memory"] >= 100_000
+    assert stats["peak_memory"] >= 100_000
+
+
+def test_tracemalloc_started():
+    tracemalloc.start()
+    try:
+        traced()
+        # tracing that was started elsewhere isn't stopped
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+    stats = _stats(traced)
+    assert stats["memory"] >= 100_000
+    assert stats["peak_memory"] >= 100_000
+
+
+def test_tracemalloc_nested():
+    traced_outer()
+
+    # tracing is process-wide, so the inner call isn't profiled
+    outer, inner = _stats(traced_outer), _stats(traced)
+    assert outer["calls"] == inner["calls"] == 1
+    assert outer["memory"] >= 100_000
+    assert inner["memory"] == 0
+
+
+def test_report():
+    Spam().method(1)
+    Spam().method(1)
+
+    report = instrumentation.report().splitlines()
+    assert report[0].split() == [
+        "function",
+        "type",
+        "decorator",
+        "sample",
+        "calls",
+        "sampled_calls",
+        "sampled_errors",
+        "p50",
+        "p90",
+        "p99",
+        "memory",
+    ]
+    (row,) = [line for line in report if ".Spam.method " in line]
+    assert row.split()[1:7] == [
+        "method",
+        f"{__name__}.Timed",
+        "1/1",
+        "2",
+        "2",
+        "0",
+    ]
+
+
+def test_quantile():
+    stats = instrumentation.CallStats("spam", "ham")
+    assert math.isnan(stats.quantile(0.5))
+
+    for _ in range(9):
+        stats.record(0)
+    stats.record(int(1e12))
+    assert stats.quantile(0.5) == instrumentation.BUCKETS[0]
+    assert stats.quantile(0.9) == instrumentation.BUCKETS[0]
+    assert stats.quantile(0.99) == math.inf
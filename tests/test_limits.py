@@ -0,0 +1,212 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from classy_decorators import ConcurrencyLimit, RateLimit
+from classy_decorators.limits import _Limit
+
+
+class Spam:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = self.max_running = 0
+        self.order = []
+
+    def _enter(self, key):
+        with self.lock:
+            self.order.append(key)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def _exit(self):
+        with self.lock:
+            self.running -= 1
+
+    @ConcurrencyLimit(2)
+    def method(self, key=None):
+        self._enter(key)
+        time.sleep(0.01)
+        self._exit()
+        return key
+
+    @ConcurrencyLimit(2)
+    async def method_async(self, key=None):
+        self._enter(key)
+        await asyncio.sleep(0.01)
+        self._exit()
+        return key
+
+    @ConcurrencyLimit(1)  # noqa
+    @classmethod
+    def classmethod(cls):
+        return cls
+
+    @RateLimit(rate=100, burst=2)
+    def rated(self):
+        return time.monotonic()
+
+    @RateLimit(rate=100)
+    async def rated_async(self):
+        return time.monotonic()
+
+
+def _run_threads(fn, n):
+    threads = [threading.Thread(target=fn, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrency_threads():
+    spam = Spam()
+    _run_threads(spam.method, 8)
+    assert spam.max_running == 2
+    assert sorted(spam.order) == list(range(8))
+
+
+def test_concurrency_per_instance():
+    spam, ham = Spam(), Spam()
+    assert spam.method._limit is spam.method._limit
+    assert spam.method._limit is not ham.method._limit
+    assert Spam.classmethod._limit is Spam().classmethod._limit
+    assert Spam.classmethod() is Spam
+
+
+def test_concurrency_function():
+    running = []
+
+    @ConcurrencyLimit(max_concurrency=1)
+    def eggs(i):
+        running.append(i)
+        assert len(running) == 1
+        time.sleep(0.001)
+        running.pop()
+
+    _run_threads(eggs, 4)
+    assert not running
+
+
+def test_concurrency_asyncio():
+    spam = Spam()
+
+    async def main():
+        return await asyncio.gather(*(spam.method_async(i) for i in range(8)))
+
+    assert asyncio.run(main()) == list(range(8))
+    assert spam.max_running == 2
+    # the waiting tasks are served in FIFO order
+    assert spam.order == list(range(8))
+
+
+def test_concurrency_asyncio_cancel():
+    spam = Spam()
+
+    async def main():
+        tasks = [asyncio.ensure_future(spam.method_async(i)) for i in range(4)]
+        await asyncio.sleep(0)
+        tasks[2].cancel()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert isinstance(results[2], asyncio.CancelledError)
+    assert results[:2] + results[3:] == [0, 1, 3]
+    # the permits are all released
+    assert len(spam.method_async._limit.permits) == 2
+
+
+def test_concurrency_asyncio_cancel_granted():
+    @ConcurrencyLimit(1)
+    async def eggs(i):
+        await asyncio.sleep(0)
+        return i
+
+    async def main():
+        limit = eggs._limit
+        await limit.acquire_async()
+        tasks = [asyncio.ensure_future(eggs(i)) for i in range(3)]
+        await asyncio.sleep(0)
+        assert len(limit.waiters) == 3
+
+        limit.release()
+        # the permit is granted to the first waiter, which is cancelled
+        # before it resumes; so it passes the permit on
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        return await asyncio.wait_for(
+            asyncio.gather(*tasks, return_exceptions=True), timeout=1
+        )
+
+    results = asyncio.run(main())
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == [1, 2]
+    assert len(eggs._limit.permits) == 1
+
+
+def test_concurrency_exception():
+    @ConcurrencyLimit(1)
+    def eggs():
+        raise ValueError
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            eggs()
+    assert len(eggs._limit.permits) == 1
+
+
+def test_rate():
+    spam = Spam()
+    start = time.monotonic()
+    times = [spam.rated() for _ in range(5)]
+
+    # a burst of 2, and then one call per 10 ms; only the lower bounds are
+    # checked, since the calls can be delayed further on a loaded machine
+    assert all(t - start >= 0.01 * i - 0.001 for i, t in enumerate(times, -1))
+    assert all(b >= a for a, b in zip(times, times[1:]))
+
+
+def test_rate_asyncio():
+    spam = Spam()
+
+    async def main():
+        start = time.monotonic()
+        times = await asyncio.gather(*(spam.rated_async() for _ in range(4)))
+        return [t - start for t in times]
+
+    times = asyncio.run(main())
+    assert all(b >= a for a, b in zip(times, times[1:]))
+    assert times[-1] >= 0.029
+
+
+@pytest.mark.parametrize(
+    "decorator",
+    [
+        lambda: ConcurrencyLimit(0),
+        lambda: RateLimit(0.0),
+        lambda: RateLimit(1.0, burst=0),
+    ],
+)
+def test_invalid_params(decorator):
+    with pytest.raises(ValueError):
+
+        @decorator()
+        def eggs():
+            ...
+
+
+def test_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+
+        @_Limit
+        def eggs():
+            ...
+
+
+def test_generator():
+    with pytest.raises(TypeError):
+
+        @ConcurrencyLimit(1)
+        def eggs():
+            yield
@@ -0,0 +1,177 @@
+import asyncio
+import gc
+import time
+
+import pytest
+
+from classy_decorators import CacheInfo, Decorator, Memoize
+
+
+def _spam_class():
+    class Spam:
+        def __init__(self):
+            self.calls = 0
+
+        @Memoize(maxsize=2)
+        def method(self, value):
+            self.calls += 1
+            return value
+
+        @Memoize  # noqa
+        @classmethod
+        def classmethod(cls, value):
+            cls.calls = getattr(cls, "calls", 0) + 1
+            return value
+
+        @Memoize
+        async def method_async(self, value):
+            self.calls += 1
+            return value
+
+    return Spam
+
+
+def test_function():
+    calls = []
+
+    @Memoize
+    def eggs(a, b=0):
+        calls.append((a, b))
+        return a + b
+
+    assert eggs(1) == eggs(1) == 1
+    assert eggs(1, b=2) == eggs(1, b=2) == 3
+    assert calls == [(1, 0), (1, 2)]
+    assert eggs.cache_info() == CacheInfo(2, 2, 128, 2)
+
+    eggs.cache_clear()
+    assert eggs.cache_info() == CacheInfo(0, 0, 128, 0)
+
+
+def test_typed():
+    @Memoize(typed=True)
+    def eggs(a):
+        return type(a)
+
+    assert eggs(1) is int
+    assert eggs(1.0) is float
+    assert eggs.cache_info().currsize == 2
+
+
+def test_maxsize():
+    Spam = _spam_class()
+    obj = Spam()
+    for value in (1, 2, 1, 3, 1, 2):
+        obj.method(value)
+
+    # 1 was used recently, 2 was evicted by 3
+    assert obj.calls == 4
+    assert obj.method.cache_info() == CacheInfo(2, 4, 2, 2)
+
+
+def test_ttl(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    calls = []
+
+    @Memoize(ttl=10)
+    def eggs():
+        calls.append(None)
+
+    eggs()
+    now += 9
+    eggs()
+    assert len(calls) == 1
+
+    now += 1
+    eggs()
+    assert len(calls) == 2
+
+
+def test_per_instance():
+    Spam = _spam_class()
+    a, b = Spam(), Spam()
+    assert a.method(1) == b.method(1) == a.method(1) == 1
+
+    assert a.calls == b.calls == 1
+    assert a.method.cache_info() == CacheInfo(1, 1, 2, 1)
+    assert Spam.method.cache_info() == CacheInfo(1, 2, 2, 2)
+
+    a.method.cache_clear()
+    assert a.method.cache_info().currsize == 0
+    assert b.method.cache_info().currsize == 1
+
+    Spam.method.cache_clear()
+    assert Spam.method.cache_info().currsize == 0
+
+
+def test_per_class():
+    Spam = _spam_class()
+
+    class SubSpam(Spam):
+        pass
+
+    assert Spam.classmethod(1) == Spam().classmethod(1) == 1
+    assert SubSpam.classmethod(1) == 1
+    assert Spam.calls == 1
+    assert SubSpam.calls == 2
+
+    assert Spam.classmethod.cache_info().hits == 1
+    assert SubSpam.classmethod.cache_info().hits == 0
+    assert Spam.__dict__["classmethod"].cache_info().currsize == 2
+
+
+def test_no_reference():
+    Spam = _spam_class()
+    obj = Spam()
+    obj.method(1)
+    assert Spam.method.cache_info().currsize == 1
+
+    del obj
+    gc.collect()
+    assert Spam.method.cache_info().currsize == 0
+
+
+def test_async():
+    Spam = _spam_class()
+    obj = Spam()
+
+    async def main():
+        return [await obj.method_async(1), await obj.method_async(1)]
+
+    assert asyncio.run(main()) == [1, 1]
+    assert obj.calls == 1
+
+
+def test_no_weakref():
+    class Slotted:
+        __slots__ = ()
+
+        @Memoize
+        def method(self):
+            ...
+
+    with pytest.raises(TypeError):
+        _ = Slotted().method
+
+
+def test_generator():
+    with pytest.raises(TypeError):
+
+        @Memoize
+        def eggs():
+            yield
+
+
+def test_methods_allowed():
+    class MyDecorator(Decorator):
+        spam: int = 1
+
+        def method(self):
+            ...
+
+        @property
+        def prop(self):
+            ...
+
+    assert list(MyDecorator.__decorator_params__) == ["spam"]
@@ -0,0 +1,166 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from classy_decorators import Decorator, Offload, offload
+
+
+@Offload
+def thread_ident():
+    return threading.get_ident()
+
+
+@Offload(executor="process", max_workers=2)
+def pid(n=0):
+    return os.getpid(), n
+
+
+class Spam:
+    def __init__(self, value=21):
+        self.value = value
+
+    @Offload
+    def method(self, n):
+        return self.value * n
+
+    @Offload(executor="process")
+    def method_process(self, n):
+        return os.getpid(), self.value * n
+
+    @Offload  # noqa
+    @classmethod
+    def classmethod(cls, n):
+        return cls, n
+
+    @Offload  # noqa
+    @staticmethod
+    def staticmethod(n):
+        return n
+
+
+class Multiply(Decorator):
+    def __call_inner__(self, *args, **kwargs):
+        res = super().__call_inner__(*args, **kwargs) * 2
+        return threading.get_ident(), res
+
+
+class OffloadTracked(Offload, Multiply):
+    def __call_inner__(self, *args, **kwargs):
+        future = super().__call_inner__(*args, **kwargs)
+        return threading.get_ident(), future
+
+
+@OffloadTracked
+def tracked():
+    return 21
+
+
+def test_thread():
+    future = thread_ident()
+    assert isinstance(future, Future)
+    assert future.result() != threading.get_ident()
+
+
+def test_methods():
+    spam = Spam()
+    assert spam.method(2).result() == 42
+    assert Spam.classmethod(1).result() == (Spam, 1)
+    assert spam.classmethod(1).result() == (Spam, 1)
+    assert Spam.staticmethod(3).result() == 3
+    assert spam.staticmethod(3).result() == 3
+
+
+def test_process():
+    res_pid, n = pid(n=6).result()
+    assert res_pid != os.getpid()
+    assert n == 6
+
+    res_pid, value = Spam(2).method_process(3).result()
+    assert res_pid != os.getpid()
+    assert value == 6
+
+
+def test_shared_pool():
+    @Offload
+    def ham():
+        return threading.current_thread().name
+
+    assert offload._get_pool("thread", None) is offload._get_pool(
+        "thread", None
+    )
+    assert ham().result().startswith("Offload")
+
+
+def test_exception():
+    @Offload
+    def ham():
+        raise ValueError("ham")
+
+    with pytest.raises(ValueError, match="ham"):
+        ham().result()
+
+
+def test_asyncio():
+    async def main():
+        awaitable = Spam().method(2)
+        assert isinstance(awaitable, asyncio.Future)
+        return await awaitable
+
+    assert asyncio.run(main()) == 42
+
+
+def test_shutdown():
+    assert thread_ident().result()
+    Offload.shutdown()
+    assert not offload._pools
+    # a new pool is created when needed
+    assert thread_ident().result()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [dict(executor="spam"), dict(max_workers=0)]
+)
+def test_invalid_params(kwargs):
+    with pytest.raises(ValueError):
+
+        @Offload(**kwargs)
+        def ham():
+            ...
+
+
+def test_invalid_function():
+    with pytest.raises(TypeError):
+
+        @Offload
+        async def ham():
+            ...
+
+    with pytest.raises(TypeError):
+
+        @Offload
+        def eggs():
+            yield
+
+
+def test_subclass():
+    # the override runs in the caller, the mixin after Offload in the pool
+    caller, future = tracked()
+    assert caller == threading.get_ident()
+    worker, res = future.result()
+    assert worker != caller
+    assert res == 42
+
+
+def test_lazy_hooks():
+    code = (
+        "from classy_decorators import offload;"
+        "assert not offload._hooks_registered;"
+        "offload._get_pool('thread', None);"
+        "assert offload._hooks_registered"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
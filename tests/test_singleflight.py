@@ -0,0 +1,199 @@
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from classy_decorators import FlightInfo, Singleflight
+
+
+class WeakSingleflight(Singleflight, weak=True):
+    pass
+
+
+class Spam:
+    def __init__(self):
+        self.calls = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    @Singleflight
+    def method(self, key):
+        self.calls.append(key)
+        self.started.set()
+        self.release.wait(5)
+        if key == "error":
+            raise ValueError(key)
+        return [key]
+
+    @Singleflight
+    async def method_async(self, key):
+        self.calls.append(key)
+        await asyncio.sleep(0.01)
+        if key == "error":
+            raise ValueError(key)
+        return [key]
+
+    @WeakSingleflight
+    def method_weak(self, key):
+        self.calls.append(key)
+        self.started.set()
+        self.release.wait(5)
+        return [key]
+
+    @Singleflight
+    def recursive(self, n):
+        self.calls.append(n)
+        return n if n < 0 else self.recursive(n)
+
+
+def _call_threads(fn, *args, n=8):
+    results = [None] * n
+
+    def target(i):
+        try:
+            results[i] = fn(*args)
+        except Exception as exc:
+            results[i] = exc
+
+    threads = [
+        threading.Thread(target=target, args=(i,)) for i in range(n)
+    ]
+    return threads, results
+
+
+def _run(spam, fn, *args, n=8):
+    threads, results = _call_threads(fn, *args, n=n)
+    calls = fn.flight_info().calls + n
+    threads[0].start()
+    assert spam.started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    # wait until the others are waiting for the first one
+    while fn.flight_info().calls < calls:
+        threading.Event().wait(0.001)
+    spam.release.set()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_threads():
+    spam = Spam()
+    info = spam.method.flight_info()
+    results = _run(spam, spam.method, 1)
+
+    assert spam.calls == [1]
+    assert results == [[1]] * 8
+    # the result is shared
+    assert all(res is results[0] for res in results)
+    assert spam.method.flight_info() == FlightInfo(
+        info.calls + 8, info.deduplicated + 7, 0
+    )
+
+    # once done, the function is called again
+    assert spam.method(1) == [1]
+    assert spam.calls == [1, 1]
+
+
+def test_weak():
+    spam = Spam()
+    fn = spam.method_weak
+    threads, results = _call_threads(fn, 1, n=1)
+    threads[0].start()
+    assert spam.started.wait(5)
+
+    # the call in flight references the instance, although the binding
+    # doesn't, so that another instance can't get its id meanwhile
+    (target, _), = fn._flights.pending
+    assert target.target is spam
+
+    spam.release.set()
+    threads[0].join()
+    assert results == [[1]]
+    assert not fn._flights.pending
+
+    del spam, target
+    gc.collect()
+    with pytest.raises(ReferenceError):
+        fn(1)
+
+
+def test_threads_exception():
+    spam = Spam()
+    results = _run(spam, spam.method, "error")
+
+    assert spam.calls == ["error"]
+    assert all(isinstance(res, ValueError) for res in results)
+
+
+def test_keys():
+    spam, ham = Spam(), Spam()
+    spam.release.set()
+    ham.release.set()
+
+    assert spam.method(1) == [1]
+    assert spam.method(key=1) == [1]
+    assert ham.method(1) == [1]
+    assert spam.calls == [1, 1]
+    assert ham.calls == [1]
+
+
+def test_recursive():
+    spam = Spam()
+    with pytest.raises(RecursionError):
+        spam.recursive(1)
+    assert spam.recursive(-1) == -1
+
+
+def test_asyncio():
+    spam = Spam()
+
+    async def main():
+        return await asyncio.gather(
+            *(spam.method_async(1) for _ in range(5)), spam.method_async(2)
+        )
+
+    info = Spam.method_async.flight_info()
+    results = asyncio.run(main())
+    assert results == [[1]] * 5 + [[2]]
+    assert spam.calls == [1, 2]
+    assert Spam.method_async.flight_info() == FlightInfo(
+        info.calls + 6, info.deduplicated + 4, 0
+    )
+
+
+def test_asyncio_exception():
+    spam = Spam()
+
+    async def main():
+        return await asyncio.gather(
+            *(spam.method_async("error") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    assert spam.calls == ["error"]
+    assert all(isinstance(res, ValueError) for res in results)
+
+
+def test_asyncio_cancel():
+    spam = Spam()
+
+    async def main():
+        first = asyncio.ensure_future(spam.method_async(1))
+        second = asyncio.ensure_future(spam.method_async(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == [1]
+    assert spam.calls == [1]
+
+
+def test_generator():
+    with pytest.raises(TypeError):
+
+        @Singleflight
+        def ham():
+            yield
@@ -1,3 +1,5 @@
+import functools
+import inspect
 from typing import Any, ClassVar, Dict, List, Optional, Type, TypeVar
 
 import pytest
@@ -43,6 +45,52 @@ def test_function_type(fn, tp: FunctionType):
     assert get_function_type(fn) is tp
 
 
+def _wraps(function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        ...
+
+    return wrapper
+
+
+class Callable:
+    def __call__(self, spam):
+        ...
+
+
+def _signature(self, spam):
+    ...
+
+
+setattr(_signature, "__signature__", inspect.signature(eggs))
+
+
+@pytest.mark.parametrize(
+    "fn, tp",
+    [
+        (lambda self, *args: ..., FunctionType.INSTANCEMETHOD_UNBOUND),
+        (lambda *self: ..., FunctionType.INSTANCEMETHOD_UNBOUND),
+        (lambda *, self: ..., FunctionType.INSTANCEMETHOD_UNBOUND),
+        (lambda **self: ..., FunctionType.INSTANCEMETHOD_UNBOUND),
+        (lambda spam, self: ..., FunctionType.FUNCTION),
+        (lambda *args, self: ..., FunctionType.FUNCTION),
+        (_wraps(Spam.method), FunctionType.INSTANCEMETHOD_UNBOUND),
+        (_wraps(_wraps(eggs)), FunctionType.FUNCTION),
+        (_signature, FunctionType.FUNCTION),
+        (functools.partial(Spam.method), FunctionType.INSTANCEMETHOD_UNBOUND),
+        (functools.partial(Spam.method, Spam()), FunctionType.FUNCTION),
+        (Callable(), FunctionType.FUNCTION),
+        (Spam, FunctionType.FUNCTION),
+        (sorted, FunctionType.INSTANCEMETHOD_BOUND),
+        (type.__call__, FunctionType.INSTANCEMETHOD_UNBOUND),
+        # no signature, unlike e.g. `str.format` since Python 3.13
+        (dict.update, FunctionType.FUNCTION),
+    ],
+)
+def test_function_type_signature(fn, tp: FunctionType):
+    assert get_function_type(fn) is tp
+
+
 @pytest.mark.parametrize(
     "tp_bound,tp_unbound,tp",
     [